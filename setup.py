@@ -0,0 +1,35 @@
+"""Build script for roadcli.
+
+The argv parser in ``roadcli.cli`` is compiled with Cython when it is
+available. The extension is optional: if it fails to build (for example
+without a C compiler) the pure-Python module is installed instead. Set
+``ROADCLI_CYTHON=0`` to skip compiling altogether.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+
+if os.environ.get("ROADCLI_CYTHON", "1") != "0":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            ["src/roadcli/cli.py"],
+            language_level=3,
+            compiler_directives={
+                "boundscheck": False,
+                "wraparound": False,
+                "initializedcheck": False,
+                "annotation_typing": False,
+            },
+        )
+        # Without a working C compiler, fall back to the pure-Python module.
+        for ext in ext_modules:
+            ext.optional = True
+
+setup(ext_modules=ext_modules)
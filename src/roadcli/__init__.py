@@ -1 +1,11 @@
 """roadcli - BlackRoad OS"""
+
+__version__ = "0.1.0"
+
+from roadcli.cli import CLI
+
+app = CLI(
+    "road",
+    version=__version__,
+    help="🖤🛣️ RoadCLI - BlackRoad Command Line Interface",
+)
@@ -0,0 +1,6 @@
+"""Allow ``python -m roadcli`` and serve as the entry point for frozen builds."""
+
+from roadcli.main import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+# Cython declarations for cli.py, applied only when setup.py compiles it.
+
+cimport cython
+
+
+cdef class Parser:
+    cdef public object command
+
+    @cython.locals(i=Py_ssize_t, arg_idx=Py_ssize_t, n=Py_ssize_t,
+                   n_arguments=Py_ssize_t, arguments=list, arg=str,
+                   arg_len=Py_ssize_t, c0=Py_UCS4, options_done=bint)
+    cpdef parse(self, object args)
+
+    cdef inline object _find_option(self, str name)
+    cdef inline object _find_option_short(self, str short)
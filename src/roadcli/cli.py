@@ -5,13 +5,20 @@ Build command-line applications with commands and options.
 
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Type
+import importlib
 import sys
 import logging
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
 
-@dataclass
+
+class UsageError(Exception):
+    """Raised by the parser when the command line does not match the command."""
+
+
+@dataclass(slots=True)
 class Option:
     name: str
     short: str = ""
@@ -20,9 +27,10 @@ class Option:
     required: bool = False
     help: str = ""
     multiple: bool = False
+    is_flag: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Argument:
     name: str
     type: Type = str
@@ -32,7 +40,7 @@ class Argument:
     nargs: str = ""  # "", "*", "+", "?"
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     name: str
     handler: Callable
@@ -40,17 +48,57 @@ class Command:
     options: List[Option] = field(default_factory=list)
     arguments: List[Argument] = field(default_factory=list)
     subcommands: Dict[str, "Command"] = field(default_factory=dict)
+    options_by_name: Dict[str, Option] = field(default_factory=dict, repr=False)
+    options_by_short: Dict[str, Option] = field(default_factory=dict, repr=False)
+    option_defaults: Dict[str, Any] = field(default_factory=dict, repr=False)
+    argument_defaults: Dict[str, Any] = field(default_factory=dict, repr=False)
+    loader: Optional[Callable[[], "Command"]] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        for opt in self.options:
+            self._index_option(opt)
+        for arg in self.arguments:
+            self.argument_defaults.setdefault(arg.name, arg.default)
+
+    def add_option(self, opt: Option, index: Optional[int] = None) -> None:
+        if index is None:
+            self.options.append(opt)
+        else:
+            self.options.insert(index, opt)
+        self._index_option(opt)
+
+    def add_argument(self, arg: Argument, index: Optional[int] = None) -> None:
+        if index is None:
+            self.arguments.append(arg)
+        else:
+            self.arguments.insert(index, arg)
+        self.argument_defaults.setdefault(arg.name, arg.default)
+
+    def _index_option(self, opt: Option) -> None:
+        self.options_by_name.setdefault(opt.name, opt)
+        self.option_defaults.setdefault(opt.name, opt.default)
+        if opt.short:
+            self.options_by_short.setdefault(opt.short, opt)
 
 
 class Context:
+    __slots__ = ("options", "arguments", "parent", "command", "help_requested")
+
     def __init__(self):
         self.options: Dict[str, Any] = {}
         self.arguments: Dict[str, Any] = {}
         self.parent: Optional["Context"] = None
         self.command: Optional[Command] = None
+        self.help_requested = False
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.options.get(key, self.arguments.get(key, default))
+        if key in self.options:
+            return self.options[key]
+        if key in self.arguments:
+            return self.arguments[key]
+        if self.parent is not None:
+            return self.parent.get(key, default)
+        return default
 
 
 class Parser:
@@ -60,83 +108,131 @@ class Parser:
     def parse(self, args: List[str]) -> Context:
         ctx = Context()
         ctx.command = self.command
+        ctx.options = dict(self.command.option_defaults)
+        ctx.arguments = dict(self.command.argument_defaults)
         
         i = 0
         arg_idx = 0
+        n = len(args)
+        arguments = self.command.arguments
+        n_arguments = len(arguments)
         collected_args: Dict[str, List[Any]] = {}
+        options_done = False
         
-        while i < len(args):
+        while i < n:
             arg = args[i]
+            arg_len = len(arg)
+            # After "--" every token is positional, even if it starts with "-".
+            c0 = arg[0] if arg_len and not options_done else "\0"
             
-            if arg.startswith("--"):
+            if c0 == "-" and arg_len > 1 and arg[1] == "-":
+                if arg_len == 2:
+                    options_done = True
+                    i += 1
+                    continue
                 key = arg[2:]
+                value = None
                 if "=" in key:
                     key, value = key.split("=", 1)
-                else:
-                    i += 1
-                    value = args[i] if i < len(args) else None
                 
                 opt = self._find_option(key)
-                if opt:
-                    ctx.options[opt.name] = self._convert(value, opt.type)
-            elif arg.startswith("-") and len(arg) == 2:
+                if opt is None:
+                    if key == "help":
+                        ctx.help_requested = True
+                        return ctx
+                    raise UsageError(f"No such option: --{key}")
+                if opt.is_flag and value is None:
+                    ctx.options[opt.name] = True
+                else:
+                    if value is None:
+                        i += 1
+                        if i >= n:
+                            raise UsageError(f"Option '--{key}' requires an argument.")
+                        value = args[i]
+                    ctx.options[opt.name] = self._convert(value, opt.type, f"--{key}")
+            elif c0 == "-" and arg_len == 2:
                 short = arg[1]
                 opt = self._find_option_short(short)
-                if opt:
+                if opt is None:
+                    if short == "h":
+                        ctx.help_requested = True
+                        return ctx
+                    raise UsageError(f"No such option: -{short}")
+                if opt.is_flag:
+                    ctx.options[opt.name] = True
+                else:
                     i += 1
-                    value = args[i] if i < len(args) else None
-                    ctx.options[opt.name] = self._convert(value, opt.type)
+                    if i >= n:
+                        raise UsageError(f"Option '-{short}' requires an argument.")
+                    ctx.options[opt.name] = self._convert(args[i], opt.type, f"-{short}")
             else:
                 if arg in self.command.subcommands:
-                    sub_parser = Parser(self.command.subcommands[arg])
-                    sub_ctx = sub_parser.parse(args[i + 1:])
-                    sub_ctx.parent = ctx
+                    self._check_required(ctx, arg_idx, collected_args)
+                    sub = self.command.subcommands[arg]
+                    if sub.loader is not None:
+                        sub = sub.loader()
+                    sub_parser = Parser(sub)
+                    rest = args[i + 1:]
+                    sub_ctx = sub_parser.parse(["--", *rest] if options_done else rest)
+                    root = sub_ctx
+                    while root.parent is not None:
+                        root = root.parent
+                    root.parent = ctx
                     return sub_ctx
                 
-                if arg_idx < len(self.command.arguments):
-                    arg_def = self.command.arguments[arg_idx]
+                if arg_idx < n_arguments:
+                    arg_def = arguments[arg_idx]
                     if arg_def.nargs in ("*", "+"):
                         if arg_def.name not in collected_args:
                             collected_args[arg_def.name] = []
-                        collected_args[arg_def.name].append(self._convert(arg, arg_def.type))
+                        collected_args[arg_def.name].append(self._convert(arg, arg_def.type, arg_def.name.upper()))
                     else:
-                        ctx.arguments[arg_def.name] = self._convert(arg, arg_def.type)
+                        ctx.arguments[arg_def.name] = self._convert(arg, arg_def.type, arg_def.name.upper())
                         arg_idx += 1
+                elif self.command.subcommands:
+                    raise UsageError(f"No such command '{arg}'.")
+                else:
+                    raise UsageError(f"Got unexpected extra argument ({arg})")
             
             i += 1
         
+        self._check_required(ctx, arg_idx, collected_args)
         for name, values in collected_args.items():
             ctx.arguments[name] = values
         
-        self._apply_defaults(ctx)
         return ctx
 
-    def _find_option(self, name: str) -> Optional[Option]:
+    def _check_required(self, ctx: Context, arg_idx: int, collected_args: Dict[str, List[Any]]) -> None:
         for opt in self.command.options:
-            if opt.name == name:
-                return opt
-        return None
+            if opt.required and ctx.options.get(opt.name) is None:
+                raise UsageError(f"Missing option '--{opt.name}'.")
+        for idx, arg_def in enumerate(self.command.arguments):
+            if not arg_def.required or arg_def.nargs in ("*", "?"):
+                continue
+            if arg_def.nargs == "+":
+                missing = arg_def.name not in collected_args
+            else:
+                missing = idx >= arg_idx
+            if missing:
+                raise UsageError(f"Missing argument '{arg_def.name.upper()}'.")
+
+    def _find_option(self, name: str) -> Optional[Option]:
+        return self.command.options_by_name.get(name)
 
     def _find_option_short(self, short: str) -> Optional[Option]:
-        for opt in self.command.options:
-            if opt.short == short:
-                return opt
-        return None
+        return self.command.options_by_short.get(short)
 
-    def _convert(self, value: Any, typ: Type) -> Any:
+    def _convert(self, value: Any, typ: Type, label: str = "") -> Any:
         if value is None:
             return None
-        if typ == bool:
-            return value.lower() in ("true", "1", "yes", "on")
-        return typ(value)
-
-    def _apply_defaults(self, ctx: Context) -> None:
-        for opt in self.command.options:
-            if opt.name not in ctx.options:
-                ctx.options[opt.name] = opt.default
-        for arg in self.command.arguments:
-            if arg.name not in ctx.arguments:
-                ctx.arguments[arg.name] = arg.default
+        if typ is str:
+            return value
+        if typ is bool:
+            return value.lower() in _TRUTHY
+        try:
+            return typ(value)
+        except (ValueError, TypeError):
+            raise UsageError(f"Invalid value for '{label}': {value!r}") from None
 
 
 class CLI:
@@ -146,6 +242,7 @@ class CLI:
         self.help = help
         self.root = Command(name=name, handler=self._default_handler, help=help)
         self.hooks: Dict[str, List[Callable]] = {"before": [], "after": [], "error": []}
+        self._handler_to_cmd: Dict[Callable, Command] = {}
 
     def _default_handler(self, ctx: Context) -> int:
         self.print_help()
@@ -155,30 +252,48 @@ class CLI:
         def decorator(fn: Callable) -> Callable:
             cmd = Command(name=name, handler=fn, help=help)
             self.root.subcommands[name] = cmd
+            self._handler_to_cmd[fn] = cmd
             return fn
         return decorator
 
-    def option(self, name: str, short: str = "", type: Type = str, default: Any = None, required: bool = False, help: str = "") -> Callable:
+    def lazy_group(self, name: str, module: str, help: str = "") -> None:
+        """Register a command group whose module is imported only when it is invoked.
+
+        The module must create ``Group(cli, name)``, which replaces the placeholder.
+        """
+        if name in self.root.subcommands:
+            return
+
+        def load() -> Command:
+            importlib.import_module(module)
+            return self.root.subcommands[name]
+
+        self.root.subcommands[name] = Command(name=name, handler=self._default_handler, help=help, loader=load)
+
+    def option(self, name: str, short: str = "", type: Type = str, default: Any = None, required: bool = False, help: str = "", is_flag: bool = False) -> Callable:
+        if is_flag:
+            type = bool
+            default = bool(default)
+
         def decorator(fn: Callable) -> Callable:
             cmd = self._find_command_for_handler(fn)
             if cmd:
-                cmd.options.append(Option(name=name, short=short, type=type, default=default, required=required, help=help))
+                # Decorators apply bottom-up; insert so help lists options top-down.
+                cmd.add_option(Option(name=name, short=short, type=type, default=default, required=required, help=help, is_flag=is_flag), index=0)
             return fn
         return decorator
 
-    def argument(self, name: str, type: Type = str, required: bool = True, help: str = "", nargs: str = "") -> Callable:
+    def argument(self, name: str, type: Type = str, required: bool = True, default: Any = None, help: str = "", nargs: str = "") -> Callable:
         def decorator(fn: Callable) -> Callable:
             cmd = self._find_command_for_handler(fn)
             if cmd:
-                cmd.arguments.append(Argument(name=name, type=type, required=required, help=rue, nargs=nargs))
+                # Decorators apply bottom-up; insert so positions read top-down.
+                cmd.add_argument(Argument(name=name, type=type, required=required, default=default, help=help, nargs=nargs), index=0)
             return fn
         return decorator
 
     def _find_command_for_handler(self, fn: Callable) -> Optional[Command]:
-        for cmd in self.root.subcommands.values():
-            if cmd.handler == fn:
-                return cmd
-        return None
+        return self._handler_to_cmd.get(fn)
 
     def add_hook(self, event: str, handler: Callable) -> None:
         if event in self.hooks:
@@ -201,6 +316,10 @@ class CLI:
             parser = Parser(self.root)
             ctx = parser.parse(args)
             
+            if ctx.help_requested:
+                self._print_context_help(ctx)
+                return 0
+            
             if ctx.command and ctx.command.handler:
                 result = ctx.command.handler(ctx)
                 
@@ -208,6 +327,13 @@ class CLI:
                     hook(ctx, result)
                 
                 return result if isinstance(result, int) else 0
+        except UsageError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        except (EOFError, KeyboardInterrupt):
+            # Input closed or Ctrl-C at a prompt
+            print("\nAborted!", file=sys.stderr)
+            return 1
         except Exception as e:
             for hook in self.hooks["error"]:
                 hook(e)
@@ -217,15 +343,50 @@ class CLI:
         return 0
 
     def print_help(self) -> None:
-        print(f"{self.name} {self.version}")
+        lines = [f"{self.name} {self.version}"]
         if self.help:
-            print(f"\n{self.help}")
-        print("\nCommands:")
-        for name, cmd in self.root.subcommands.items():
-            print(f"  {name:15} {cmd.help}")
-        print("\nOptions:")
-        print("  -h, --help     Show this help message")
-        print("  -v, --version  Show version")
+            lines += ["", self.help]
+        lines += ["", "Commands:"]
+        lines.extend(f"  {name:15} {cmd.help}" for name, cmd in self.root.subcommands.items())
+        lines += ["", "Options:", *self._option_lines(self.root.options)]
+        lines.append(f"  {'-v, --version':15} Show version")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _print_context_help(self, ctx: Context) -> None:
+        """Print help for the command ``ctx`` was parsed for."""
+        names = []
+        node = ctx
+        while node is not None:
+            names.append(node.command.name)
+            node = node.parent
+        if len(names) == 1:
+            self.print_help()
+            return
+        self.print_command_help(" ".join(reversed(names)), ctx.command)
+
+    def print_command_help(self, prog: str, command: Command) -> None:
+        lines = [prog]
+        if command.help:
+            lines += ["", command.help]
+        if command.subcommands:
+            lines += ["", "Commands:"]
+            lines.extend(f"  {name:15} {cmd.help}" for name, cmd in command.subcommands.items())
+        if command.arguments:
+            lines += ["", "Arguments:"]
+            lines.extend(
+                f"  {arg.name.upper() if arg.required else f'[{arg.name.upper()}]':15} {arg.help}".rstrip()
+                for arg in command.arguments
+            )
+        lines += ["", "Options:", *self._option_lines(command.options)]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _option_lines(self, options: List[Option]) -> List[str]:
+        lines = []
+        for opt in options:
+            flags = f"-{opt.short}, --{opt.name}" if opt.short else f"    --{opt.name}"
+            lines.append(f"  {flags:15} {opt.help}")
+        lines.append(f"  {'-h, --help':15} Show this help message")
+        return lines
 
 
 class Group:
@@ -233,16 +394,24 @@ class Group:
         self.cli = cli
         self.name = name
         self.help = help
-        self.parent = Command(name=name, handler=lambda ctx: 0, help=help)
+        self.parent = Command(name=name, handler=self._default_handler, help=help)
         cli.root.subcommands[name] = self.parent
 
+    def _default_handler(self, ctx: Context) -> int:
+        self.print_help()
+        return 0
+
     def command(self, name: str, help: str = "") -> Callable:
         def decorator(fn: Callable) -> Callable:
             cmd = Command(name=name, handler=fn, help=help)
             self.parent.subcommands[name] = cmd
+            self.cli._handler_to_cmd[fn] = cmd
             return fn
         return decorator
 
+    def print_help(self) -> None:
+        self.cli.print_command_help(f"{self.cli.name} {self.name}", self.parent)
+
 
 def example_usage():
     app = CLI("myapp", version="1.0.0", help="My CLI application")
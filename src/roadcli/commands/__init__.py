@@ -1 +1,24 @@
 """RoadCLI command modules."""
+
+import os
+import sys
+
+
+def get_console():
+    """Return the shared console from roadcli.interactive, importing it on first use."""
+    from roadcli.interactive import get_console
+    return get_console()
+
+
+def plain_output() -> bool:
+    """Return True when tables should be written as plain tab-separated text.
+
+    That is the case when stdout is not a terminal or ``ROAD_PLAIN`` is set to
+    anything other than an empty string or ``0``.
+    """
+    return os.getenv("ROAD_PLAIN", "") not in ("", "0") or not sys.stdout.isatty()
+
+
+def write_plain(rows) -> None:
+    """Write rows of strings to stdout as tab-separated lines."""
+    sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
@@ -1,29 +1,68 @@
 """AI commands for RoadCLI."""
 
-import click
-import httpx
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.live import Live
-from rich.spinner import Spinner
-
-console = Console()
-
-
-@click.group()
-def ai():
-    """AI model commands - chat, complete, embed."""
-    pass
-
-
-@ai.command()
-@click.argument("message", required=False)
-@click.option("--model", "-m", default="gpt-4o-mini", help="Model to use")
-@click.option("--system", "-s", default=None, help="System prompt")
-@click.option("--server", default="http://localhost:8000", help="RoadAI server URL")
-@click.option("--stream", is_flag=True, help="Stream response")
-@click.pass_context
-def chat(ctx, message, model, system, server, stream):
+from roadcli import app
+from roadcli.cli import Group
+from roadcli.commands import get_console, plain_output, write_plain
+
+ai = Group(app, "ai", help="AI model commands - chat, complete, embed.")
+
+_client = None
+
+
+def _get_client():
+    """Return the module's shared httpx client, creating it on first use.
+
+    HTTP/2 is enabled when the optional ``h2`` package is installed.
+    """
+    global _client
+    if _client is None:
+        import atexit
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        _client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def _stream_chat(url: str, payload: dict, console) -> None:
+    """Render a server-sent-events chat completion as it arrives."""
+    import json
+    from rich.live import Live
+    from rich.markdown import Markdown
+
+    buf = ""
+    with _get_client().stream("POST", url, json=payload, timeout=None) as response:
+        response.raise_for_status()
+        with Live(Markdown(buf), console=console, refresh_per_second=10) as live:
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                chunk = line[5:].strip()
+                if chunk == "[DONE]":
+                    break
+                choices = json.loads(chunk).get("choices") or [{}]
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    buf += delta
+                    live.update(Markdown(buf))
+
+
+@app.argument("message", required=False)
+@app.option("model", short="m", default="gpt-4o-mini", help="Model to use")
+@app.option("system", short="s", default=None, help="System prompt")
+@app.option("server", default="http://localhost:8000", help="RoadAI server URL")
+@app.option("stream", is_flag=True, help="Stream response")
+@ai.command("chat", help="Chat with an AI model.")
+def chat(ctx):
     """Chat with an AI model.
 
     Examples:
@@ -31,35 +70,53 @@ def chat(ctx, message, model, system, server, stream):
         road ai chat --model claude-3.5-sonnet "Explain async/await"
         echo "Summarize this" | road ai chat
     """
+    import json
     import sys
+    import httpx
+    from rich.markdown import Markdown
+    from roadcli.prompts import prompt
+
+    console = get_console()
+    message = ctx.get("message")
+    model = ctx.get("model")
+    system = ctx.get("system")
+    server = ctx.get("server")
+    stream = ctx.get("stream")
 
     # Get message from argument or stdin
     if not message:
         if not sys.stdin.isatty():
             message = sys.stdin.read().strip()
         else:
-            message = click.prompt("Message")
+            message = prompt("Message")
 
     if not message:
         console.print("[red]No message provided[/red]")
-        return
+        return 0
 
     messages = []
     if system:
         messages.append({"role": "system", "content": system})
     messages.append({"role": "user", "content": message})
 
+    url = f"{server}/v1/chat/completions"
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": stream,
+    }
+
     try:
+        if stream:
+            try:
+                _stream_chat(url, payload, console)
+            except json.JSONDecodeError as e:
+                console.print(f"[red]Stream error: malformed event from server ({e})[/red]")
+                return 1
+            return 0
+
         with console.status(f"[bold cyan]Thinking ({model})...[/bold cyan]"):
-            response = httpx.post(
-                f"{server}/v1/chat/completions",
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "stream": stream,
-                },
-                timeout=120.0,
-            )
+            response = _get_client().post(url, json=payload, timeout=120.0)
             response.raise_for_status()
 
         data = response.json()
@@ -69,7 +126,7 @@ def chat(ctx, message, model, system, server, stream):
         console.print(Markdown(content))
 
         # Show usage
-        if ctx.obj.get("verbose"):
+        if ctx.get("verbose"):
             usage = data.get("usage", {})
             console.print(f"\n[dim]Model: {data['model']} via {data['provider']}[/dim]")
             console.print(f"[dim]Tokens: {usage.get('total_tokens', 0)}[/dim]")
@@ -78,25 +135,37 @@ def chat(ctx, message, model, system, server, stream):
 
     except httpx.HTTPError as e:
         console.print(f"[red]Error: {e}[/red]")
-        raise click.Abort()
+        return 1
+
+    return 0
 
 
-@ai.command()
-@click.option("--server", default="http://localhost:8000", help="RoadAI server URL")
-def models(server):
+@app.option("server", default="http://localhost:8000", help="RoadAI server URL")
+@ai.command("models", help="List available AI models.")
+def models(ctx):
     """List available AI models."""
-    from rich.table import Table
+    import httpx
+
+    console = get_console()
+    server = ctx.get("server")
 
     try:
-        response = httpx.get(f"{server}/providers", timeout=10.0)
+        response = _get_client().get(f"{server}/providers", timeout=10.0)
         response.raise_for_status()
         data = response.json()
+        rows = sorted(data.get("models", {}).items())
+
+        if plain_output():
+            write_plain(rows)
+            return 0
+
+        from rich.table import Table
 
         table = Table(title="Available Models")
         table.add_column("Model", style="cyan")
         table.add_column("Provider", style="green")
 
-        for model, provider in sorted(data.get("models", {}).items()):
+        for model, provider in rows:
             table.add_row(model, provider)
 
         console.print(table)
@@ -104,13 +173,20 @@ def models(server):
     except httpx.HTTPError as e:
         console.print(f"[red]Error: {e}[/red]")
 
+    return 0
 
-@ai.command()
-@click.option("--server", default="http://localhost:8000", help="RoadAI server URL")
-def health(server):
+
+@app.option("server", default="http://localhost:8000", help="RoadAI server URL")
+@ai.command("health", help="Check AI provider health.")
+def health(ctx):
     """Check AI provider health."""
+    import httpx
+
+    console = get_console()
+    server = ctx.get("server")
+
     try:
-        response = httpx.get(f"{server}/health", timeout=10.0)
+        response = _get_client().get(f"{server}/health", timeout=10.0)
         response.raise_for_status()
         data = response.json()
 
@@ -126,3 +202,5 @@ def health(server):
 
     except httpx.HTTPError as e:
         console.print(f"[red]✗ Server unreachable: {e}[/red]")
+
+    return 0
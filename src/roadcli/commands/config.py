@@ -1,22 +1,79 @@
 """Configuration commands for RoadCLI."""
 
-import click
+import functools
+import operator
+import os
 from pathlib import Path
-from rich.console import Console
-from rich.syntax import Syntax
 
-console = Console()
+from roadcli import app
+from roadcli.cli import Group
+from roadcli.commands import get_console
 
+config = Group(app, "config", help="Configuration management - get, set, edit.")
 
-@click.group()
-def config():
-    """Configuration management - get, set, edit."""
-    pass
+_CONFIG_PATH = Path(os.environ.get("ROAD_CONFIG", "~/.roadcli/config.yaml")).expanduser()
+_MISSING = object()
 
 
-@config.command()
-@click.argument("key", required=False)
-def get(key):
+def get_config_path(ctx=None) -> Path:
+    """Return the config file location.
+
+    The root ``--config`` option wins when ``ctx`` carries it, then
+    ``ROAD_CONFIG``, then ``~/.roadcli/config.yaml``.
+    """
+    override = ctx.get("config") if ctx is not None else None
+    if override:
+        return Path(override).expanduser()
+    return _CONFIG_PATH
+
+
+def _yaml_loader():
+    """Return the libyaml-backed safe loader when available."""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_dumper():
+    """Return the libyaml-backed safe dumper when available."""
+    import yaml
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int, size: int):
+    import yaml
+
+    with open(path) as f:
+        return yaml.load(f, Loader=_yaml_loader())
+
+
+def _config_id(config_path: Path):
+    """Identify a version of the config file by path, mtime and size."""
+    st = config_path.stat()
+    return str(config_path), st.st_mtime_ns, st.st_size
+
+
+def _load_config(config_path: Path):
+    """Parse the config file, reusing the cached result while it is unchanged.
+
+    The returned object is shared between calls; copy it before mutating.
+    """
+    return _parse_config(*_config_id(config_path))
+
+
+@functools.lru_cache(maxsize=256)
+def _get_nested(path: str, mtime_ns: int, size: int, key: str):
+    """Resolve a dotted key against a config version, or return _MISSING."""
+    cfg = _parse_config(path, mtime_ns, size)
+    try:
+        return functools.reduce(operator.getitem, key.split("."), cfg)
+    except (KeyError, TypeError):
+        return _MISSING
+
+
+@app.argument("key", required=False)
+@config.command("get", help="Get configuration value(s).")
+def get(ctx):
     """Get configuration value(s).
 
     Examples:
@@ -25,54 +82,55 @@ def get(key):
         road config get ai.default_model
     """
     import yaml
+    from rich.syntax import Syntax
 
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
+    console = get_console()
+    key = ctx.get("key")
 
-    if not config_path.exists():
+    try:
+        config_id = _config_id(get_config_path(ctx))
+    except FileNotFoundError:
         console.print("[yellow]No config file. Run 'road init' first.[/yellow]")
         return
 
-    with open(config_path) as f:
-        cfg = yaml.safe_load(f)
-
     if key:
         # Navigate to nested key
-        parts = key.split(".")
-        value = cfg
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                console.print(f"[yellow]Key '{key}' not found[/yellow]")
-                return
+        value = _get_nested(*config_id, key)
+        if value is _MISSING:
+            console.print(f"[yellow]Key '{key}' not found[/yellow]")
+            return
         console.print(value)
     else:
         # Show full config
-        content = yaml.dump(cfg, default_flow_style=False)
+        cfg = _parse_config(*config_id)
+        content = yaml.dump(cfg, Dumper=_yaml_dumper(), default_flow_style=False)
         console.print(Syntax(content, "yaml"))
 
 
-@config.command("set")
-@click.argument("key")
-@click.argument("value")
-def set_config(key, value):
+@app.argument("key")
+@app.argument("value")
+@config.command("set", help="Set a configuration value.")
+def set_config(ctx):
     """Set a configuration value.
 
     Examples:
         road config set api.url https://api.blackroad.io
         road config set ai.default_model claude-3.5-sonnet
     """
+    import copy
     import yaml
 
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
+    console = get_console()
+    key = ctx.get("key")
+    value = ctx.get("value")
+    config_path = get_config_path(ctx)
 
-    if not config_path.exists():
+    try:
+        cfg = copy.deepcopy(_load_config(config_path)) or {}
+    except FileNotFoundError:
         console.print("[yellow]No config file. Run 'road init' first.[/yellow]")
         return
 
-    with open(config_path) as f:
-        cfg = yaml.safe_load(f) or {}
-
     # Navigate and set nested key
     parts = key.split(".")
     current = cfg
@@ -83,52 +141,65 @@ def set_config(key, value):
 
     # Try to parse value as YAML (for booleans, numbers, etc.)
     try:
-        parsed_value = yaml.safe_load(value)
+        parsed_value = yaml.load(value, Loader=_yaml_loader())
     except:
         parsed_value = value
 
     current[parts[-1]] = parsed_value
 
     with open(config_path, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
+        yaml.dump(cfg, f, Dumper=_yaml_dumper(), default_flow_style=False)
 
     console.print(f"[green]✓ Set {key} = {parsed_value}[/green]")
 
 
-@config.command()
-def edit():
+@config.command("edit", help="Open config file in editor.")
+def edit(ctx):
     """Open config file in editor."""
-    import os
-    import subprocess
+    import sys
 
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
+    console = get_console()
+    config_path = get_config_path(ctx)
 
     if not config_path.exists():
         console.print("[yellow]No config file. Run 'road init' first.[/yellow]")
         return
 
     editor = os.getenv("EDITOR", "vim")
-    subprocess.run([editor, str(config_path)])
+    # Replace this process with the editor rather than waiting on a child.
+    sys.stdout.flush()
+    try:
+        os.execvp(editor, [editor, str(config_path)])
+    except FileNotFoundError:
+        print(f"Error: editor '{editor}' not found", file=sys.stderr)
+        return 1
 
 
-@config.command()
-def path():
+@config.command("path", help="Show config file path.")
+def path(ctx):
     """Show config file path."""
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
+    console = get_console()
+    config_path = get_config_path(ctx)
     console.print(str(config_path))
-    if config_path.exists():
-        console.print(f"[dim]Size: {config_path.stat().st_size} bytes[/dim]")
-    else:
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         console.print("[yellow]File does not exist[/yellow]")
+    else:
+        console.print(f"[dim]Size: {st.st_size} bytes[/dim]")
 
 
-@config.command()
-def reset():
+@config.command("reset", help="Reset configuration to defaults.")
+def reset(ctx):
     """Reset configuration to defaults."""
-    if not click.confirm("Reset all configuration?"):
+    from roadcli.prompts import confirm
+
+    if not confirm("Reset all configuration?"):
         return
 
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
-    if config_path.exists():
-        config_path.unlink()
-        console.print("[green]✓ Config reset. Run 'road init' to create new config.[/green]")
+    console = get_console()
+    try:
+        get_config_path(ctx).unlink()
+    except FileNotFoundError:
+        return
+    console.print("[green]✓ Config reset. Run 'road init' to create new config.[/green]")
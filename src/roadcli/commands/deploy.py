@@ -1,24 +1,35 @@
 """Deployment commands for RoadCLI."""
 
-import click
-from rich.console import Console
-from rich.table import Table
+from roadcli import app
+from roadcli.cli import Group
+from roadcli.commands import get_console, plain_output, write_plain
 
-console = Console()
+deploy = Group(app, "deploy", help="Deployment commands - deploy, rollback, status.")
 
 
-@click.group()
-def deploy():
-    """Deployment commands - deploy, rollback, status."""
-    pass
-
+def _run_streaming(cmd, console) -> int:
+    """Run ``cmd``, echoing its combined stdout/stderr line by line."""
+    import subprocess
 
-@deploy.command()
-@click.argument("target", required=False)
-@click.option("--provider", "-p", default="cloudflare", help="Deploy provider")
-@click.option("--branch", "-b", default="main", help="Git branch")
-@click.option("--dry-run", is_flag=True, help="Show what would be deployed")
-def push(target, provider, branch, dry_run):
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    with proc.stdout:
+        for line in proc.stdout:
+            console.print(line, end="", markup=False, highlight=False)
+    return proc.wait()
+
+
+@app.argument("target", required=False)
+@app.option("provider", short="p", default="cloudflare", help="Deploy provider")
+@app.option("branch", short="b", default="main", help="Git branch")
+@app.option("dry-run", is_flag=True, help="Show what would be deployed")
+@deploy.command("push", help="Deploy to a target environment.")
+def push(ctx):
     """Deploy to a target environment.
 
     Examples:
@@ -26,10 +37,13 @@ def push(target, provider, branch, dry_run):
         road deploy push staging --branch develop
         road deploy push --dry-run
     """
-    import subprocess
     import os
 
-    target = target or "production"
+    console = get_console()
+    target = ctx.get("target") or "production"
+    provider = ctx.get("provider")
+    branch = ctx.get("branch")
+    dry_run = ctx.get("dry-run")
 
     if dry_run:
         console.print(f"[yellow]DRY RUN[/yellow] Would deploy to {target}")
@@ -37,43 +51,50 @@ def push(target, provider, branch, dry_run):
         console.print(f"  Branch: {branch}")
         return
 
-    with console.status(f"[bold cyan]Deploying to {target}...[/bold cyan]"):
-        if provider == "cloudflare":
-            # Check for wrangler.toml
-            if os.path.exists("wrangler.toml"):
-                result = subprocess.run(
-                    ["wrangler", "pages", "deploy", ".", "--branch", branch],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    console.print(f"[green]✓ Deployed to Cloudflare Pages[/green]")
-                    console.print(result.stdout)
-                else:
-                    console.print(f"[red]✗ Deploy failed[/red]")
-                    console.print(result.stderr)
-            else:
-                console.print("[yellow]No wrangler.toml found. Creating deploy...[/yellow]")
+    console.print(f"[bold cyan]Deploying to {target}...[/bold cyan]")
 
-        elif provider == "railway":
-            result = subprocess.run(
-                ["railway", "up", "--detach"],
-                capture_output=True,
-                text=True,
+    if provider == "cloudflare":
+        # Check for wrangler.toml
+        if os.path.exists("wrangler.toml"):
+            returncode = _run_streaming(
+                ["wrangler", "pages", "deploy", ".", "--branch", branch],
+                console,
             )
-            if result.returncode == 0:
-                console.print(f"[green]✓ Deployed to Railway[/green]")
+            if returncode == 0:
+                console.print("[green]✓ Deployed to Cloudflare Pages[/green]")
             else:
-                console.print(f"[red]✗ Deploy failed: {result.stderr}[/red]")
+                console.print("[red]✗ Deploy failed[/red]")
+        else:
+            console.print("[yellow]No wrangler.toml found. Creating deploy...[/yellow]")
 
+    elif provider == "railway":
+        returncode = _run_streaming(["railway", "up", "--detach"], console)
+        if returncode == 0:
+            console.print("[green]✓ Deployed to Railway[/green]")
         else:
-            console.print(f"[red]Unknown provider: {provider}[/red]")
+            console.print("[red]✗ Deploy failed[/red]")
+
+    else:
+        console.print(f"[red]Unknown provider: {provider}[/red]")
 
 
-@deploy.command("list")
-@click.option("--provider", "-p", default=None, help="Filter by provider")
-def list_deployments(provider):
+@app.option("provider", short="p", default=None, help="Filter by provider")
+@deploy.command("list", help="List recent deployments.")
+def list_deployments(ctx):
     """List recent deployments."""
+    # Mock data - would connect to actual deployment tracking
+    deployments = [
+        ("deploy-abc123", "production", "✓ success", "main", "5 minutes ago"),
+        ("deploy-xyz789", "staging", "✓ success", "develop", "2 hours ago"),
+        ("deploy-def456", "preview", "✓ success", "feature/new-ui", "1 day ago"),
+    ]
+
+    if plain_output():
+        write_plain(deployments)
+        return
+
+    from rich.table import Table
+
     table = Table(title="Recent Deployments")
     table.add_column("ID", style="cyan")
     table.add_column("Environment", style="green")
@@ -81,18 +102,16 @@ def list_deployments(provider):
     table.add_column("Branch", style="blue")
     table.add_column("Time")
 
-    # Mock data - would connect to actual deployment tracking
-    table.add_row("deploy-abc123", "production", "✓ success", "main", "5 minutes ago")
-    table.add_row("deploy-xyz789", "staging", "✓ success", "develop", "2 hours ago")
-    table.add_row("deploy-def456", "preview", "✓ success", "feature/new-ui", "1 day ago")
+    for row in deployments:
+        table.add_row(*row)
 
-    console.print(table)
+    get_console().print(table)
 
 
-@deploy.command()
-@click.argument("deployment_id", required=False)
-@click.option("--steps", "-n", default=1, help="Number of versions to rollback")
-def rollback(deployment_id, steps):
+@app.argument("deployment_id", required=False)
+@app.option("steps", short="n", type=int, default=1, help="Number of versions to rollback")
+@deploy.command("rollback", help="Rollback a deployment.")
+def rollback(ctx):
     """Rollback a deployment.
 
     Examples:
@@ -100,6 +119,9 @@ def rollback(deployment_id, steps):
         road deploy rollback deploy-abc123
         road deploy rollback --steps 2
     """
+    console = get_console()
+    deployment_id = ctx.get("deployment_id")
+    steps = ctx.get("steps")
     if deployment_id:
         console.print(f"[yellow]Rolling back to {deployment_id}...[/yellow]")
     else:
@@ -109,10 +131,12 @@ def rollback(deployment_id, steps):
     console.print("[green]✓ Rollback complete[/green]")
 
 
-@deploy.command()
-@click.argument("environment", default="production")
-def status(environment):
+@app.argument("environment", required=False, default="production")
+@deploy.command("status", help="Show deployment status for an environment.")
+def status(ctx):
     """Show deployment status for an environment."""
+    console = get_console()
+    environment = ctx.get("environment")
     console.print(f"[bold]Deployment Status: {environment}[/bold]\n")
 
     console.print("Current Version: [cyan]v1.2.3[/cyan]")
@@ -1,24 +1,74 @@
 """Secrets management commands for RoadCLI."""
 
-import click
-from rich.console import Console
-from rich.table import Table
-
-console = Console()
-
-
-@click.group()
-def secrets():
-    """Secrets management - set, get, list, delete."""
-    pass
-
-
-@secrets.command()
-@click.argument("name")
-@click.argument("value", required=False)
-@click.option("--from-env", is_flag=True, help="Read value from environment")
-@click.option("--provider", "-p", default="local", help="Secrets provider")
-def set(name, value, from_env, provider):
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+
+from roadcli import app
+from roadcli.cli import Group
+from roadcli.commands import get_console, plain_output, write_plain
+
+secrets = Group(app, "secrets", help="Secrets management - set, get, list, delete.")
+
+# Secret names are indexed locally so listing never has to query the keyring.
+_INDEX_PATH = Path("~/.roadcli/secrets.index").expanduser()
+
+
+@contextlib.contextmanager
+def _index_lock():
+    """Serialize index updates across concurrent road processes."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        fcntl = None
+
+    _INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(_INDEX_PATH.with_suffix(".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _read_index() -> list:
+    try:
+        with open(_INDEX_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def _update_index(name: str, provider: str, remove: bool = False) -> None:
+    """Add, refresh or remove one entry, replacing the index atomically."""
+    with _index_lock():
+        entries = [
+            e for e in _read_index()
+            if not (e["name"] == name and e["provider"] == provider)
+        ]
+        if not remove:
+            entries.append({"name": name, "provider": provider, "mtime": time.time()})
+        tmp = _INDEX_PATH.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp, _INDEX_PATH)
+
+
+def _ago(timestamp: float) -> str:
+    seconds = max(0, int(time.time() - timestamp))
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = seconds // size
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    return "just now"
+
+
+@app.argument("name")
+@app.argument("value", required=False)
+@app.option("from-env", is_flag=True, help="Read value from environment")
+@app.option("provider", short="p", default="local", help="Secrets provider")
+@secrets.command("set", help="Set a secret.")
+def set(ctx):
     """Set a secret.
 
     Examples:
@@ -26,11 +76,16 @@ def set(name, value, from_env, provider):
         road secrets set API_KEY --from-env
         echo "secret" | road secrets set MY_SECRET
     """
-    import os
     import sys
     import keyring
+    from roadcli.prompts import prompt
+
+    console = get_console()
+    name = ctx.get("name")
+    value = ctx.get("value")
+    provider = ctx.get("provider")
 
-    if from_env:
+    if ctx.get("from-env"):
         value = os.getenv(name)
         if not value:
             console.print(f"[red]Environment variable {name} not set[/red]")
@@ -39,7 +94,7 @@ def set(name, value, from_env, provider):
         if not sys.stdin.isatty():
             value = sys.stdin.read().strip()
         else:
-            value = click.prompt(f"Value for {name}", hide_input=True)
+            value = prompt(f"Value for {name}", hide_input=True)
 
     if not value:
         console.print("[red]No value provided[/red]")
@@ -49,17 +104,26 @@ def set(name, value, from_env, provider):
         # Use system keyring
         try:
             keyring.set_password("roadcli", name, value)
-            console.print(f"[green]✓ Secret '{name}' saved to keyring[/green]")
         except Exception as e:
             console.print(f"[red]Failed to save secret: {e}[/red]")
+            return
+        try:
+            _update_index(name, provider)
+        except OSError as e:
+            console.print(
+                f"[yellow]Secret '{name}' saved to keyring, "
+                f"but the secrets index could not be updated: {e}[/yellow]"
+            )
+            return
+        console.print(f"[green]✓ Secret '{name}' saved to keyring[/green]")
     else:
         console.print(f"[yellow]Provider '{provider}' not implemented[/yellow]")
 
 
-@secrets.command()
-@click.argument("name")
-@click.option("--provider", "-p", default="local", help="Secrets provider")
-def get(name, provider):
+@app.argument("name")
+@app.option("provider", short="p", default="local", help="Secrets provider")
+@secrets.command("get", help="Get a secret value.")
+def get(ctx):
     """Get a secret value.
 
     Examples:
@@ -67,6 +131,10 @@ def get(name, provider):
     """
     import keyring
 
+    console = get_console()
+    name = ctx.get("name")
+    provider = ctx.get("provider")
+
     if provider == "local":
         try:
             value = keyring.get_password("roadcli", name)
@@ -78,28 +146,46 @@ def get(name, provider):
             console.print(f"[red]Failed to get secret: {e}[/red]")
 
 
-@secrets.command("list")
-@click.option("--provider", "-p", default="local", help="Secrets provider")
-def list_secrets(provider):
+@app.option("provider", short="p", default="local", help="Secrets provider")
+@secrets.command("list", help="List all secrets (names only, not values).")
+def list_secrets(ctx):
     """List all secrets (names only, not values)."""
+    provider = ctx.get("provider")
+    entries = sorted(
+        (e for e in _read_index() if e["provider"] == provider),
+        key=lambda e: e["name"],
+    )
+    rows = [(e["name"], e["provider"], _ago(e["mtime"])) for e in entries]
+
+    if plain_output():
+        write_plain(rows)
+        return
+
+    from rich.table import Table
+
+    console = get_console()
+
+    if not rows:
+        console.print(f"[yellow]No secrets stored for provider '{provider}'[/yellow]")
+        return
+
     table = Table(title="Secrets")
     table.add_column("Name", style="cyan")
     table.add_column("Provider", style="green")
     table.add_column("Last Modified")
 
-    # Would list actual secrets from keyring/provider
-    table.add_row("API_KEY", "local", "2 hours ago")
-    table.add_row("DATABASE_URL", "local", "1 day ago")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print("[dim]Values are hidden. Use 'road secrets get <name>' to retrieve.[/dim]")
 
 
-@secrets.command()
-@click.argument("name")
-@click.option("--provider", "-p", default="local", help="Secrets provider")
-@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
-def delete(name, provider, force):
+@app.argument("name")
+@app.option("provider", short="p", default="local", help="Secrets provider")
+@app.option("force", short="f", is_flag=True, help="Skip confirmation")
+@secrets.command("delete", help="Delete a secret.")
+def delete(ctx):
     """Delete a secret.
 
     Examples:
@@ -107,14 +193,32 @@ def delete(name, provider, force):
         road secrets delete API_KEY --force
     """
     import keyring
+    from keyring.errors import PasswordDeleteError
+    from roadcli.prompts import confirm
+
+    console = get_console()
+    name = ctx.get("name")
+    provider = ctx.get("provider")
 
-    if not force:
-        if not click.confirm(f"Delete secret '{name}'?"):
+    if not ctx.get("force"):
+        if not confirm(f"Delete secret '{name}'?"):
             return
 
     if provider == "local":
         try:
             keyring.delete_password("roadcli", name)
-            console.print(f"[green]✓ Secret '{name}' deleted[/green]")
+            in_keyring = True
+        except PasswordDeleteError:
+            # Already gone from the keyring; still drop any stale index entry.
+            in_keyring = False
         except Exception as e:
             console.print(f"[red]Failed to delete secret: {e}[/red]")
+            return
+        try:
+            _update_index(name, provider, remove=True)
+        except OSError as e:
+            console.print(f"[yellow]The secrets index could not be updated: {e}[/yellow]")
+        if in_keyring:
+            console.print(f"[green]✓ Secret '{name}' deleted[/green]")
+        else:
+            console.print(f"[yellow]Secret '{name}' not found in keyring[/yellow]")
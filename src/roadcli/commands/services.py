@@ -1,34 +1,22 @@
 """Service management commands for RoadCLI."""
 
-import click
-from rich.console import Console
-from rich.table import Table
+from roadcli import app
+from roadcli.cli import Group
+from roadcli.commands import get_console, plain_output, write_plain
 
-console = Console()
+services = Group(app, "services", help="Service management - status, logs, restart.")
 
 
-@click.group()
-def services():
-    """Service management - status, logs, restart."""
-    pass
-
-
-@services.command()
-@click.argument("service", required=False)
-def status(service):
+@app.argument("service", required=False)
+@services.command("status", help="Show service status.")
+def status(ctx):
     """Show service status.
 
     Examples:
         road services status
         road services status api-gateway
     """
-    table = Table(title="Service Status")
-    table.add_column("Service", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("Health")
-    table.add_column("Uptime")
-    table.add_column("CPU")
-    table.add_column("Memory")
+    service = ctx.get("service")
 
     # Mock data - would connect to actual service monitoring
     services_data = [
@@ -38,19 +26,33 @@ def status(service):
         ("worker-1", "running", "✓", "1d 6h", "67%", "512MB"),
         ("redis", "running", "✓", "10d 3h", "5%", "64MB"),
     ]
+    rows = [svc for svc in services_data if service is None or service == svc[0]]
+
+    if plain_output():
+        write_plain(rows)
+        return
+
+    from rich.table import Table
 
-    for svc in services_data:
-        if service is None or service == svc[0]:
-            table.add_row(*svc)
+    table = Table(title="Service Status")
+    table.add_column("Service", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Health")
+    table.add_column("Uptime")
+    table.add_column("CPU")
+    table.add_column("Memory")
+
+    for svc in rows:
+        table.add_row(*svc)
 
-    console.print(table)
+    get_console().print(table)
 
 
-@services.command()
-@click.argument("service")
-@click.option("--lines", "-n", default=50, help="Number of lines")
-@click.option("--follow", "-f", is_flag=True, help="Follow log output")
-def logs(service, lines, follow):
+@app.argument("service")
+@app.option("lines", short="n", type=int, default=50, help="Number of lines")
+@app.option("follow", short="f", is_flag=True, help="Follow log output")
+@services.command("logs", help="View service logs.")
+def logs(ctx):
     """View service logs.
 
     Examples:
@@ -58,6 +60,10 @@ def logs(service, lines, follow):
         road services logs roadai --follow
         road services logs worker-1 -n 100
     """
+    console = get_console()
+    service = ctx.get("service")
+    lines = ctx.get("lines")
+    follow = ctx.get("follow")
     console.print(f"[bold]Logs for {service}[/bold] (last {lines} lines)\n")
 
     # Mock log output
@@ -79,18 +85,23 @@ def logs(service, lines, follow):
         console.print("\n[dim]Following logs... (Ctrl+C to stop)[/dim]")
 
 
-@services.command()
-@click.argument("service")
-@click.option("--force", "-f", is_flag=True, help="Force restart")
-def restart(service, force):
+@app.argument("service")
+@app.option("force", short="f", is_flag=True, help="Force restart")
+@services.command("restart", help="Restart a service.")
+def restart(ctx):
     """Restart a service.
 
     Examples:
         road services restart api-gateway
         road services restart worker-1 --force
     """
-    if not force:
-        if not click.confirm(f"Restart {service}?"):
+    from roadcli.prompts import confirm
+
+    console = get_console()
+    service = ctx.get("service")
+
+    if not ctx.get("force"):
+        if not confirm(f"Restart {service}?"):
             return
 
     with console.status(f"[bold cyan]Restarting {service}...[/bold cyan]"):
@@ -100,20 +111,27 @@ def restart(service, force):
     console.print(f"[green]✓ {service} restarted[/green]")
 
 
-@services.command()
-@click.argument("service")
-def stop(service):
+@app.argument("service")
+@services.command("stop", help="Stop a service.")
+def stop(ctx):
     """Stop a service."""
-    if not click.confirm(f"Stop {service}?"):
+    from roadcli.prompts import confirm
+
+    console = get_console()
+    service = ctx.get("service")
+
+    if not confirm(f"Stop {service}?"):
         return
 
     console.print(f"[yellow]Stopping {service}...[/yellow]")
     console.print(f"[green]✓ {service} stopped[/green]")
 
 
-@services.command()
-@click.argument("service")
-def start(service):
+@app.argument("service")
+@services.command("start", help="Start a service.")
+def start(ctx):
     """Start a service."""
+    console = get_console()
+    service = ctx.get("service")
     console.print(f"[cyan]Starting {service}...[/cyan]")
     console.print(f"[green]✓ {service} started[/green]")
@@ -12,30 +12,30 @@ Features:
 - Auto-completion
 """
 
-from typing import Optional, Dict, Any, List, Callable, TypeVar
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Protocol, TypeVar
 from dataclasses import dataclass
 from enum import Enum
+import functools
+import getpass
+import importlib.util
+import itertools
 import sys
-import time
-import asyncio
-from abc import ABC, abstractmethod
+import threading
 
-try:
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.prompt import Prompt, Confirm, IntPrompt
+    from rich.json import JSON
     from rich.panel import Panel
-    from rich.live import Live
-    from rich.layout import Layout
+    from rich.progress import Progress
     from rich.text import Text
-    from rich.markdown import Markdown
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+
+# Rich is optional and heavy to import; check for it here, import it where used.
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
 
 T = TypeVar('T')
 
+_YES = frozenset({'y', 'yes', 'true', '1'})
+
 
 class Theme(str, Enum):
     DEFAULT = "default"
@@ -51,12 +51,11 @@ class CLIConfig:
     interactive: bool = True
 
 
-class BaseDisplay(ABC):
-    """Base class for display components."""
+class BaseDisplay(Protocol):
+    """Interface for display components."""
 
-    @abstractmethod
     def render(self) -> str:
-        pass
+        ...
 
 
 class SimpleConsole:
@@ -69,14 +68,28 @@ class SimpleConsole:
         return input(prompt)
 
 
+@functools.lru_cache(maxsize=1)
 def get_console() -> 'Console':
-    """Get console instance."""
+    """Get the shared console instance.
+
+    Rich renders each print or Live frame into one string and issues a single
+    write() and flush() per render, so stdout is left unwrapped: an extra
+    buffer would not save syscalls and would reorder output against plain
+    ``print``/``sys.stdout.write`` callers.
+    """
     if RICH_AVAILABLE:
+        from rich.console import Console
         return Console()
     return SimpleConsole()
 
 
-console = get_console()
+def __getattr__(name: str):
+    # Module-level ``console`` and ``cli`` are built on first access (PEP 562).
+    if name == "console":
+        return get_console()
+    if name == "cli":
+        return _default_cli()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class InteractivePrompts:
@@ -93,6 +106,7 @@ class InteractivePrompts:
     ) -> str:
         """Prompt for text input."""
         if RICH_AVAILABLE:
+            from rich.prompt import Prompt
             return Prompt.ask(message, default=default, password=password)
         prompt = f"{message}"
         if default:
@@ -108,12 +122,13 @@ class InteractivePrompts:
     ) -> bool:
         """Prompt for confirmation."""
         if RICH_AVAILABLE:
+            from rich.prompt import Confirm
             return Confirm.ask(message, default=default)
         yn = " [Y/n]" if default else " [y/N]"
-        result = input(f"{message}{yn}: ").lower()
+        result = input(f"{message}{yn}: ")
         if not result:
             return default
-        return result in ('y', 'yes', 'true', '1')
+        return result.lower() in _YES
 
     def number(
         self,
@@ -124,6 +139,7 @@ class InteractivePrompts:
     ) -> int:
         """Prompt for number input."""
         if RICH_AVAILABLE:
+            from rich.prompt import IntPrompt
             while True:
                 result = IntPrompt.ask(message, default=default)
                 if min_value is not None and result < min_value:
@@ -142,19 +158,17 @@ class InteractivePrompts:
         default: int = 0,
     ) -> str:
         """Prompt for selection from list."""
-        self.console.print(f"\n{message}")
-        for i, choice in enumerate(choices):
-            marker = ">" if i == default else " "
-            self.console.print(f"  {marker} {i + 1}. {choice}")
+        self._print_menu(message, [
+            f"  {'>' if i == default else ' '} {i + 1}. {choice}"
+            for i, choice in enumerate(choices)
+        ])
 
         while True:
-            selection = self.text("Enter number", str(default + 1))
-            try:
+            selection = self.text("Enter number", str(default + 1)).strip()
+            if selection.isdecimal():
                 idx = int(selection) - 1
                 if 0 <= idx < len(choices):
                     return choices[idx]
-            except ValueError:
-                pass
             self.console.print("[red]Invalid selection[/red]")
 
     def multi_select(
@@ -167,33 +181,44 @@ class InteractivePrompts:
         defaults = defaults or []
         selected = set(defaults)
 
-        self.console.print(f"\n{message}")
-        self.console.print("  (Enter numbers separated by commas, or 'all'/'none')")
-
-        for i, choice in enumerate(choices):
-            marker = "[x]" if i in selected else "[ ]"
-            self.console.print(f"  {marker} {i + 1}. {choice}")
+        self._print_menu(message, [
+            "  (Enter numbers separated by commas, or 'all'/'none')",
+            *(
+                f"  {'[x]' if i in selected else '[ ]'} {i + 1}. {choice}"
+                for i, choice in enumerate(choices)
+            ),
+        ])
 
         selection = self.text("Selection", ",".join(str(i + 1) for i in defaults))
 
-        if selection.lower() == 'all':
+        keyword = selection.strip().lower()
+        if keyword == 'all':
             return choices
-        if selection.lower() == 'none':
+        if keyword == 'none':
             return []
 
-        indices = []
-        for part in selection.split(','):
-            try:
-                idx = int(part.strip()) - 1
-                if 0 <= idx < len(choices):
-                    indices.append(idx)
-            except ValueError:
-                pass
+        count = len(choices)
+        parts = (part.strip() for part in selection.split(','))
+        indices = (int(part) - 1 for part in parts if part.isdecimal())
+        return [choices[i] for i in indices if 0 <= i < count]
 
-        return [choices[i] for i in indices]
+    def _print_menu(self, message: str, lines: List[str]):
+        """Print a prompt heading and its choice lines in one console call.
+
+        Choice lines are plain text, so markers like ``[x]`` are not read as markup.
+        """
+        if RICH_AVAILABLE:
+            from rich.text import Text
+            text = Text.from_markup(f"\n{message}\n")
+            text.append("\n".join(lines))
+            self.console.print(text)
+        else:
+            self.console.print("\n".join([f"\n{message}", *lines]))
 
     def password(self, message: str = "Password") -> str:
         """Prompt for password (hidden input)."""
+        if sys.stdin.isatty():
+            return getpass.getpass(f"{message}: ")
         return self.text(message, password=True)
 
 
@@ -220,6 +245,44 @@ class ProgressDisplay:
         return MultiProgressContext(self.console)
 
 
+# One Progress per console, shared by every spinner/progress context that is
+# currently open on it: {id(console): [progress, open_contexts]}.
+_shared_progress: Dict[int, list] = {}
+_shared_progress_lock = threading.Lock()
+
+
+def _acquire_progress(console: 'Console') -> 'Progress':
+    """Return the console's shared Progress, starting it for the first user."""
+    with _shared_progress_lock:
+        entry = _shared_progress.get(id(console))
+        if entry is None:
+            from rich.progress import (
+                Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn,
+            )
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+                transient=True,
+            )
+            progress.start()
+            entry = _shared_progress[id(console)] = [progress, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_progress(console: 'Console'):
+    """Drop one user of the console's shared Progress, stopping it after the last."""
+    with _shared_progress_lock:
+        entry = _shared_progress[id(console)]
+        entry[1] -= 1
+        if not entry[1]:
+            del _shared_progress[id(console)]
+            entry[0].stop()
+
+
 class SpinnerContext:
     """Context manager for spinner."""
 
@@ -231,12 +294,7 @@ class SpinnerContext:
 
     def __enter__(self):
         if RICH_AVAILABLE:
-            self._progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            )
-            self._progress.start()
+            self._progress = _acquire_progress(self.console)
             self._task = self._progress.add_task(self.message, total=None)
         else:
             print(f"{self.message}...", end="", flush=True)
@@ -244,7 +302,8 @@ class SpinnerContext:
 
     def __exit__(self, *args):
         if self._progress:
-            self._progress.stop()
+            self._progress.remove_task(self._task)
+            _release_progress(self.console)
         else:
             print(" done")
 
@@ -264,22 +323,20 @@ class ProgressBarContext:
         self._progress = None
         self._task = None
         self._current = 0
+        # Plain-terminal fallback state
+        self._prefix = f"\r{description}: "
+        self._last_pct = -1
 
     def __enter__(self):
         if RICH_AVAILABLE:
-            self._progress = Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=self.console,
-            )
-            self._progress.start()
+            self._progress = _acquire_progress(self.console)
             self._task = self._progress.add_task(self.description, total=self.total)
         return self
 
     def __exit__(self, *args):
         if self._progress:
-            self._progress.stop()
+            self._progress.remove_task(self._task)
+            _release_progress(self.console)
         else:
             print()
 
@@ -289,8 +346,11 @@ class ProgressBarContext:
         if self._progress and self._task is not None:
             self._progress.advance(self._task, amount)
         else:
-            pct = int(self._current / self.total * 100)
-            print(f"\r{self.description}: {pct}%", end="", flush=True)
+            pct = self._current * 100 // self.total if self.total else 100
+            if pct != self._last_pct:
+                self._last_pct = pct
+                sys.stdout.write(f"{self._prefix}{pct}%")
+                sys.stdout.flush()
 
     def update(self, completed: int):
         """Set completed amount."""
@@ -308,18 +368,14 @@ class MultiProgressContext:
 
     def __enter__(self):
         if RICH_AVAILABLE:
-            self._progress = Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=self.console,
-            )
-            self._progress.start()
+            self._progress = _acquire_progress(self.console)
         return self
 
     def __exit__(self, *args):
         if self._progress:
-            self._progress.stop()
+            for task_id in self._tasks.values():
+                self._progress.remove_task(task_id)
+            _release_progress(self.console)
 
     def add_task(self, name: str, total: int = 100) -> str:
         """Add a task."""
@@ -393,6 +449,7 @@ class TableBuilder:
     def show(self):
         """Display the table."""
         if RICH_AVAILABLE:
+            from rich.table import Table
             table = Table(title=self._title)
             for i, col in enumerate(self._columns):
                 style = self._styles.get(i)
@@ -403,18 +460,27 @@ class TableBuilder:
 
             self.console.print(table)
         else:
-            # Simple ASCII table
+            # Simple ASCII table, padded to the widest cell per column;
+            # short rows (and a short header) are padded with empty cells.
+            widths = [
+                max(map(len, cells))
+                for cells in itertools.zip_longest(self._columns, *self._rows, fillvalue="")
+            ]
+            blanks = [""] * len(widths)
+
+            def line(cells: List[str]) -> str:
+                cells = [*cells, *blanks[len(cells):]]
+                return " | ".join(map(str.ljust, cells, widths)).rstrip()
+
+            lines = []
             if self._title:
-                print(f"\n{self._title}")
-                print("=" * len(self._title))
-
-            # Header
-            print(" | ".join(self._columns))
-            print("-" * (sum(len(c) for c in self._columns) + 3 * (len(self._columns) - 1)))
-
-            # Rows
-            for row in self._rows:
-                print(" | ".join(row))
+                lines += ["", self._title, "=" * len(self._title)]
+            if self._columns:
+                lines.append(line(self._columns))
+                lines.append("-" * (sum(widths) + 3 * (len(widths) - 1)))
+            lines.extend(map(line, self._rows))
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
 
 class LiveDisplay:
@@ -429,71 +495,131 @@ class LiveDisplay:
         columns: List[str],
         title: str = None,
         refresh_rate: float = 1.0,
+        stop_event: threading.Event = None,
     ):
-        """Show live-updating table."""
+        """Show live-updating table until Ctrl+C or ``stop_event`` is set."""
         if not RICH_AVAILABLE:
             # Fallback: just show once
             data = update_fn()
             TableDisplay(self.console).show(data, title, columns)
             return
 
+        from rich.table import Table
+        table = None
+        snapshot: List[tuple] = []
+
         def generate_table() -> Table:
-            data = update_fn()
-            table = Table(title=title)
-            for col in columns:
-                table.add_column(col)
-            for row in data:
-                table.add_row(*[str(row.get(col, "")) for col in columns])
+            # Rebuild only when some cell changed; otherwise reuse last frame's table.
+            nonlocal table, snapshot
+            rows = [tuple(str(row.get(col, "")) for col in columns) for row in update_fn()]
+            if table is None or rows != snapshot:
+                table = Table(title=title)
+                for col in columns:
+                    table.add_column(col)
+                for cells in rows:
+                    table.add_row(*cells)
+                snapshot = rows
             return table
 
-        with Live(generate_table(), console=self.console, refresh_per_second=1/refresh_rate) as live:
-            try:
-                while True:
-                    time.sleep(refresh_rate)
-                    live.update(generate_table())
-            except KeyboardInterrupt:
-                pass
+        self._run_live(generate_table, refresh_rate, stop_event)
 
     def dashboard(
         self,
         panels: Dict[str, Callable[[], str]],
         refresh_rate: float = 1.0,
+        stop_event: threading.Event = None,
     ):
-        """Show dashboard with multiple panels."""
+        """Show dashboard with multiple panels until Ctrl+C or ``stop_event`` is set."""
         if not RICH_AVAILABLE:
             for name, fn in panels.items():
                 print(f"\n{name}:")
                 print(fn())
             return
 
-        def generate_layout() -> Layout:
-            layout = Layout()
-            panel_layouts = []
-
-            for name, fn in panels.items():
-                panel = Panel(fn(), title=name)
-                panel_layouts.append(Layout(panel, name=name))
+        from rich.layout import Layout
+        from rich.panel import Panel
 
-            if len(panel_layouts) <= 2:
-                layout.split_row(*panel_layouts)
-            else:
-                # Split into rows of 2
-                rows = []
-                for i in range(0, len(panel_layouts), 2):
-                    row = Layout()
-                    row.split_row(*panel_layouts[i:i+2])
-                    rows.append(row)
-                layout.split_column(*rows)
+        # Build the layout tree once; each frame only swaps panel contents.
+        panel_map = {name: Layout(name=name) for name in panels}
+        layout = Layout()
+        leaves = list(panel_map.values())
+        if len(leaves) <= 2:
+            layout.split_row(*leaves)
+        else:
+            # Split into rows of 2
+            rows = []
+            for i in range(0, len(leaves), 2):
+                row = Layout()
+                row.split_row(*leaves[i:i+2])
+                rows.append(row)
+            layout.split_column(*rows)
 
+        def generate_layout() -> Layout:
+            for name, fn in panels.items():
+                panel_map[name].update(Panel(fn(), title=name))
             return layout
 
-        with Live(generate_layout(), console=self.console, refresh_per_second=1/refresh_rate) as live:
+        self._run_live(generate_layout, refresh_rate, stop_event)
+
+    def _run_live(
+        self,
+        get_renderable: Callable[[], Any],
+        refresh_rate: float,
+        stop_event: Optional[threading.Event],
+    ):
+        """Let Live's refresh thread pull frames while this thread just waits.
+
+        An exception raised while building a frame ends the display and is
+        re-raised here.
+        """
+        if refresh_rate <= 0:
+            raise ValueError(f"refresh_rate must be positive, got {refresh_rate!r}")
+        stop = stop_event or threading.Event()
+        errors: List[Exception] = []
+        last: List[Any] = [""]
+
+        def render():
+            if not errors:
+                try:
+                    last[0] = get_renderable()
+                except Exception as e:
+                    errors.append(e)
+            return last[0]
+
+        from rich.live import Live
+        with Live(
+            get_renderable=render,
+            console=self.console,
+            auto_refresh=True,
+            refresh_per_second=1 / refresh_rate,
+        ):
             try:
-                while True:
-                    time.sleep(refresh_rate)
-                    live.update(generate_layout())
+                # Wake once per frame so a failed frame is noticed promptly.
+                while not errors and not stop.wait(refresh_rate):
+                    pass
             except KeyboardInterrupt:
                 pass
+        if errors:
+            raise errors[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix(symbol: str, style: str) -> 'Text':
+    """Styled status symbol, built once instead of parsed from markup per call."""
+    from rich.text import Text
+    return Text(symbol, style=style)
+
+
+@functools.lru_cache(maxsize=256)
+def _header_panel(message: str) -> 'Panel':
+    from rich.panel import Panel
+    return Panel(message, style="bold")
+
+
+@functools.lru_cache(maxsize=64)
+def _json_renderable(text: str) -> 'JSON':
+    from rich.json import JSON
+    return JSON(text)
 
 
 class OutputFormatter:
@@ -505,35 +631,35 @@ class OutputFormatter:
     def success(self, message: str):
         """Show success message."""
         if RICH_AVAILABLE:
-            self.console.print(f"[green]✓[/green] {message}")
+            self.console.print(_prefix("✓", "green"), message)
         else:
             print(f"✓ {message}")
 
     def error(self, message: str):
         """Show error message."""
         if RICH_AVAILABLE:
-            self.console.print(f"[red]✗[/red] {message}")
+            self.console.print(_prefix("✗", "red"), message)
         else:
             print(f"✗ {message}")
 
     def warning(self, message: str):
         """Show warning message."""
         if RICH_AVAILABLE:
-            self.console.print(f"[yellow]⚠[/yellow] {message}")
+            self.console.print(_prefix("⚠", "yellow"), message)
         else:
             print(f"⚠ {message}")
 
     def info(self, message: str):
         """Show info message."""
         if RICH_AVAILABLE:
-            self.console.print(f"[blue]ℹ[/blue] {message}")
+            self.console.print(_prefix("ℹ", "blue"), message)
         else:
             print(f"ℹ {message}")
 
     def header(self, message: str):
         """Show header."""
         if RICH_AVAILABLE:
-            self.console.print(Panel(message, style="bold"))
+            self.console.print(_header_panel(message))
         else:
             print(f"\n{'=' * len(message)}")
             print(message)
@@ -543,14 +669,14 @@ class OutputFormatter:
         """Show formatted JSON."""
         import json as json_module
         if RICH_AVAILABLE:
-            from rich.json import JSON
-            self.console.print(JSON(json_module.dumps(data)))
+            self.console.print(_json_renderable(json_module.dumps(data)))
         else:
             print(json_module.dumps(data, indent=2))
 
     def markdown(self, content: str):
         """Render markdown."""
         if RICH_AVAILABLE:
+            from rich.markdown import Markdown
             self.console.print(Markdown(content))
         else:
             print(content)
@@ -565,6 +691,36 @@ class OutputFormatter:
             print(code)
 
 
+# Wizard step type -> handler(prompts, step) returning the step's result.
+_STEP_HANDLERS: Dict[str, Callable[[InteractivePrompts, Dict[str, Any]], Any]] = {
+    'text': lambda p, s: p.text(
+        s.get('message', s['name']),
+        default=s.get('default'),
+    ),
+    'confirm': lambda p, s: p.confirm(
+        s.get('message', s['name']),
+        default=s.get('default', False),
+    ),
+    'select': lambda p, s: p.select(
+        s.get('message', s['name']),
+        s['choices'],
+        default=s.get('default', 0),
+    ),
+    'multi_select': lambda p, s: p.multi_select(
+        s.get('message', s['name']),
+        s['choices'],
+        defaults=s.get('defaults', []),
+    ),
+    'password': lambda p, s: p.password(s.get('message', s['name'])),
+    'number': lambda p, s: p.number(
+        s.get('message', s['name']),
+        default=s.get('default'),
+        min_value=s.get('min'),
+        max_value=s.get('max'),
+    ),
+}
+
+
 class InteractiveCLI:
     """Main interactive CLI interface."""
 
@@ -586,46 +742,24 @@ class InteractiveCLI:
         results: Dict[str, Any] = {}
 
         for i, step in enumerate(steps):
-            self.output.header(f"Step {i + 1}/{len(steps)}: {step.get('title', 'Input')}")
-
-            if step.get('description'):
-                self.console.print(step['description'])
-                self.console.print()
-
-            step_type = step.get('type', 'text')
-            name = step['name']
-
-            if step_type == 'text':
-                results[name] = self.prompts.text(
-                    step.get('message', name),
-                    default=step.get('default'),
-                )
-            elif step_type == 'confirm':
-                results[name] = self.prompts.confirm(
-                    step.get('message', name),
-                    default=step.get('default', False),
-                )
-            elif step_type == 'select':
-                results[name] = self.prompts.select(
-                    step.get('message', name),
-                    step['choices'],
-                    default=step.get('default', 0),
-                )
-            elif step_type == 'multi_select':
-                results[name] = self.prompts.multi_select(
-                    step.get('message', name),
-                    step['choices'],
-                    defaults=step.get('defaults', []),
-                )
-            elif step_type == 'password':
-                results[name] = self.prompts.password(step.get('message', name))
-            elif step_type == 'number':
-                results[name] = self.prompts.number(
-                    step.get('message', name),
-                    default=step.get('default'),
-                    min_value=step.get('min'),
-                    max_value=step.get('max'),
-                )
+            header = f"Step {i + 1}/{len(steps)}: {step.get('title', 'Input')}"
+            description = step.get('description')
+
+            if RICH_AVAILABLE:
+                from rich.console import Group
+                parts = [_header_panel(header)]
+                if description:
+                    parts += [description, ""]
+                self.console.print(Group(*parts))
+            else:
+                self.output.header(header)
+                if description:
+                    self.console.print(description)
+                    self.console.print()
+
+            handler = _STEP_HANDLERS.get(step.get('type', 'text'))
+            if handler is not None:
+                results[step['name']] = handler(self.prompts, step)
 
             self.console.print()
 
@@ -635,5 +769,7 @@ class InteractiveCLI:
         return results
 
 
-# Create global instance
-cli = InteractiveCLI()
+@functools.lru_cache(maxsize=1)
+def _default_cli() -> InteractiveCLI:
+    """Global instance, exposed as ``roadcli.interactive.cli``."""
+    return InteractiveCLI()
@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
-from pathlib import Path
 
-import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
+from roadcli import __version__, app
+from roadcli.cli import Option
+from roadcli.interactive import get_console
+from roadcli.prompts import confirm
 
-from roadcli import __version__
-from roadcli.commands import ai, deploy, secrets, services, config
 
-
-console = Console()
+def __getattr__(name: str):
+    # ``console`` is created on first access so importing main stays cheap (PEP 562).
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 LOGO = """
@@ -27,65 +27,81 @@ LOGO = """
 """.format(version=__version__)
 
 
-@click.group()
-@click.version_option(version=__version__, prog_name="roadcli")
-@click.option("--config", "-c", type=click.Path(), help="Config file path")
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-@click.pass_context
-def cli(ctx, config, verbose):
-    """
-    🖤🛣️ RoadCLI - BlackRoad Command Line Interface
-
-    Unified CLI for managing BlackRoad services.
-
-    Examples:
-
-        road ai chat "Hello world"
-
-        road deploy list
+# Command groups are imported only when invoked
+app.lazy_group("ai", "roadcli.commands.ai", help="AI model commands - chat, complete, embed.")
+app.lazy_group("deploy", "roadcli.commands.deploy", help="Deployment commands - deploy, rollback, status.")
+app.lazy_group("secrets", "roadcli.commands.secrets", help="Secrets management - set, get, list, delete.")
+app.lazy_group("services", "roadcli.commands.services", help="Service management - status, logs, restart.")
+app.lazy_group("config", "roadcli.commands.config", help="Configuration management - get, set, edit.")
 
-        road secrets set MY_SECRET
+# Global options, visible to every subcommand through Context.get
+app.root.add_option(Option(
+    name="config", short="c",
+    help="Config file path (default: $ROAD_CONFIG or ~/.roadcli/config.yaml)",
+))
+app.root.add_option(Option(name="verbose", type=bool, default=False, is_flag=True, help="Verbose output"))
 
-        road services status
-    """
-    ctx.ensure_object(dict)
-    ctx.obj["verbose"] = verbose
-    ctx.obj["config_path"] = config or os.getenv("ROAD_CONFIG", "~/.roadcli/config.yaml")
-    ctx.obj["console"] = console
 
-
-@cli.command()
-def info():
-    """Show RoadCLI information and configuration."""
-    console.print(Panel(LOGO, style="bold magenta"))
+@functools.lru_cache(maxsize=1)
+def _build_info_table(config_path: str, config_mtime_ns, api_url: str, has_openai: bool, has_anthropic: bool):
+    """Build the info table; cached on the config file version and environment."""
+    from rich.table import Table
 
     table = Table(title="Configuration", show_header=True)
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    config_path = Path("~/.roadcli/config.yaml").expanduser()
-    table.add_row("Config File", str(config_path))
-    table.add_row("Config Exists", "✓" if config_path.exists() else "✗")
+    table.add_row("Config File", config_path)
+    table.add_row("Config Exists", "✓" if config_mtime_ns is not None else "✗")
     table.add_row("Version", __version__)
     table.add_row("Python", sys.version.split()[0])
 
     # Check environment
-    table.add_row("ROAD_API_URL", os.getenv("ROAD_API_URL", "not set"))
-    table.add_row("OPENAI_API_KEY", "✓ set" if os.getenv("OPENAI_API_KEY") else "✗ not set")
-    table.add_row("ANTHROPIC_API_KEY", "✓ set" if os.getenv("ANTHROPIC_API_KEY") else "✗ not set")
+    table.add_row("ROAD_API_URL", api_url)
+    table.add_row("OPENAI_API_KEY", "✓ set" if has_openai else "✗ not set")
+    table.add_row("ANTHROPIC_API_KEY", "✓ set" if has_anthropic else "✗ not set")
 
-    console.print(table)
+    return table
 
 
-@cli.command()
-@click.pass_context
+@app.command("info", help="Show RoadCLI information and configuration.")
+def info(ctx):
+    """Show RoadCLI information and configuration."""
+    from rich.panel import Panel
+    from roadcli.commands.config import get_config_path
+
+    console = get_console()
+    console.print(Panel(LOGO, style="bold magenta"))
+
+    config_path = get_config_path(ctx)
+    try:
+        config_mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        config_mtime_ns = None
+
+    env = os.environ
+    console.print(_build_info_table(
+        str(config_path),
+        config_mtime_ns,
+        env.get("ROAD_API_URL", "not set"),
+        bool(env.get("OPENAI_API_KEY")),
+        bool(env.get("ANTHROPIC_API_KEY")),
+    ))
+
+
+@app.command("init", help="Initialize RoadCLI configuration.")
 def init(ctx):
     """Initialize RoadCLI configuration."""
-    config_dir = Path("~/.roadcli").expanduser()
-    config_file = config_dir / "config.yaml"
+    from rich.panel import Panel
+    from roadcli.commands.config import get_config_path
+    from rich.syntax import Syntax
+
+    console = get_console()
+    config_file = get_config_path(ctx)
+    config_dir = config_file.parent
 
     if config_file.exists():
-        if not click.confirm("Config already exists. Overwrite?"):
+        if not confirm("Config already exists. Overwrite?"):
             return
 
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -110,21 +126,21 @@ logging:
     config_file.write_text(default_config)
     console.print(f"[green]✓[/green] Created config at {config_file}")
 
+    try:
+        import yaml
+    except ImportError:
+        console.print("[yellow]⚠ PyYAML is not installed; 'road config' commands need it[/yellow]")
+    else:
+        if not getattr(yaml, "__with_libyaml__", False):
+            console.print("[yellow]⚠ libyaml not available; config parsing will use the slower pure-Python loader[/yellow]")
+
     # Show the config
     console.print(Panel(Syntax(default_config, "yaml"), title="Config"))
 
 
-# Register command groups
-cli.add_command(ai.ai)
-cli.add_command(deploy.deploy)
-cli.add_command(secrets.secrets)
-cli.add_command(services.services)
-cli.add_command(config.config)
-
-
 def main():
     """CLI entry point."""
-    cli(obj={})
+    sys.exit(app.run())
 
 
 if __name__ == "__main__":
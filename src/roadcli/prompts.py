@@ -0,0 +1,19 @@
+"""Minimal terminal prompts for RoadCLI command handlers."""
+
+import getpass
+
+
+def prompt(text: str, hide_input: bool = False) -> str:
+    """Read one line of input, hiding it when ``hide_input`` is set."""
+    if hide_input:
+        return getpass.getpass(f"{text}: ")
+    return input(f"{text}: ")
+
+
+def confirm(text: str, default: bool = False) -> bool:
+    """Ask a yes/no question; an empty answer returns ``default``."""
+    suffix = " [Y/n]: " if default else " [y/N]: "
+    answer = input(text + suffix).strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
@@ -0,0 +1,78 @@
+"""Tests for the ai commands' streaming chat client."""
+
+import io
+import json
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("rich")
+
+from rich.console import Console
+
+from roadcli import app
+from roadcli.commands import ai
+
+
+def sse(*events):
+    return "".join(f"{line}\n" for line in events).encode()
+
+
+def delta(text):
+    return "data: " + json.dumps({"choices": [{"delta": {"content": text}}]})
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the shared client to a mock SSE endpoint returning ``body``."""
+    requests = []
+
+    def install(body):
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+        monkeypatch.setattr(ai, "_client", httpx.Client(transport=httpx.MockTransport(handler)))
+        return requests
+
+    return install
+
+
+@pytest.fixture
+def console(monkeypatch):
+    console = Console(file=io.StringIO(), width=80)
+    monkeypatch.setattr(ai, "get_console", lambda: console)
+    return console
+
+
+class TestStreamChat:
+    def test_renders_deltas_until_done(self, serve, console):
+        serve(sse(
+            ": keepalive",
+            "event: message",
+            delta("Hello"),
+            "",
+            'data: {"choices": []}',
+            delta(", world"),
+            "data: [DONE]",
+            delta(" IGNORED"),
+        ))
+        ai._stream_chat("http://test/v1/chat/completions", {"stream": True}, console)
+        out = console.file.getvalue()
+        assert "Hello, world" in out
+        assert "IGNORED" not in out
+
+    def test_chat_stream_command(self, serve, console):
+        requests = serve(sse(delta("Hi there"), "data: [DONE]"))
+        assert app.run(["ai", "chat", "--stream", "--server", "http://test", "hello"]) == 0
+        assert requests[0]["stream"] is True
+        assert requests[0]["messages"] == [{"role": "user", "content": "hello"}]
+        assert "Hi there" in console.file.getvalue()
+
+    def test_malformed_event_reported(self, serve, console):
+        serve(sse(delta("partial"), "data: {not json"))
+        assert app.run(["ai", "chat", "--stream", "--server", "http://test", "hello"]) == 1
+        assert "Stream error: malformed event" in console.file.getvalue()
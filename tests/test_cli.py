@@ -6,7 +6,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from roadcli.cli import CLI, Command, Context, Parser, Option, Argument, Group
+from roadcli.cli import CLI, Command, Context, Parser, Option, Argument, Group, UsageError
 
 
 class TestContext:
@@ -26,6 +26,14 @@ class TestContext:
         ctx.arguments["name"] = "alice"
         assert ctx.get("name") == "alice"
 
+    def test_parent_fallback(self):
+        parent = Context()
+        parent.options["verbose"] = True
+        ctx = Context()
+        ctx.parent = parent
+        assert ctx.get("verbose") is True
+        assert ctx.get("missing", "default") == "default"
+
 
 class TestParser:
     def test_parse_long_option(self):
@@ -52,6 +60,41 @@ class TestParser:
         ctx = Parser(cmd).parse(["-v", "true"])
         assert ctx.options["verbose"] == "true"
 
+    def test_parse_dash_positionals(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="out", short="o")],
+            arguments=[Argument(name="src"), Argument(name="dst"), Argument(name="extra")]
+        )
+        ctx = Parser(cmd).parse(["", "-", "-abc"])
+        assert ctx.arguments == {"src": "", "dst": "-", "extra": "-abc"}
+
+    def test_parse_tuple_args(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="out", short="o")],
+            arguments=[Argument(name="src")]
+        )
+        ctx = Parser(cmd).parse(("a.txt", "-o", "b.txt"))
+        assert ctx.arguments["src"] == "a.txt"
+        assert ctx.options["out"] == "b.txt"
+
+    def test_parse_end_of_options(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="force", short="f", is_flag=True, type=bool, default=False)],
+            arguments=[Argument(name="message"), Argument(name="extra", required=False)]
+        )
+        ctx = Parser(cmd).parse(["-f", "--", "-x", "--force"])
+        assert ctx.options["force"] is True
+        assert ctx.arguments == {"message": "-x", "extra": "--force"}
+
+    def test_end_of_options_before_subcommand(self):
+        sub = Command(name="chat", handler=lambda c: 0, arguments=[Argument(name="message")])
+        root = Command(name="root", handler=lambda c: 0, subcommands={"chat": sub})
+        ctx = Parser(root).parse(["--", "chat", "-x"])
+        assert ctx.arguments["message"] == "-x"
+
     def test_parse_int_option(self):
         cmd = Command(
             name="test", handler=lambda c: 0,
@@ -76,6 +119,29 @@ class TestParser:
         ctx = Parser(cmd).parse(["--flag", "no"])
         assert ctx.options["flag"] is False
 
+    def test_parse_bool_option_short_forms(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="flag", type=bool)]
+        )
+        assert Parser(cmd).parse(["--flag", "Y"]).options["flag"] is True
+        assert Parser(cmd).parse(["--flag", "t"]).options["flag"] is True
+        assert Parser(cmd).parse(["--flag", "n"]).options["flag"] is False
+
+    def test_parse_flag(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="force", short="f", type=bool, default=False, is_flag=True)],
+            arguments=[Argument(name="name")]
+        )
+        ctx = Parser(cmd).parse(["--force", "api"])
+        assert ctx.options["force"] is True
+        assert ctx.arguments["name"] == "api"
+        ctx = Parser(cmd).parse(["api", "-f"])
+        assert ctx.options["force"] is True
+        ctx = Parser(cmd).parse(["api"])
+        assert ctx.options["force"] is False
+
     def test_parse_positional_argument(self):
         cmd = Command(
             name="test", handler=lambda c: 0,
@@ -114,6 +180,85 @@ class TestParser:
         assert ctx.options["level"] == 3
         assert ctx.arguments["file"] == "stdin"
 
+    def test_option_index(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="output", short="o"), Option(name="quiet")]
+        )
+        assert cmd.options_by_name["output"] is cmd.options[0]
+        assert cmd.options_by_short["o"] is cmd.options[0]
+        assert "" not in cmd.options_by_short
+
+    def test_missing_required_argument(self):
+        cmd = Command(name="test", handler=lambda c: 0, arguments=[Argument(name="name")])
+        with pytest.raises(UsageError, match="Missing argument 'NAME'"):
+            Parser(cmd).parse([])
+
+    def test_missing_required_option(self):
+        cmd = Command(name="test", handler=lambda c: 0, options=[Option(name="token", required=True)])
+        with pytest.raises(UsageError, match="Missing option '--token'"):
+            Parser(cmd).parse([])
+        assert Parser(cmd).parse(["--token", "x"]).options["token"] == "x"
+
+    def test_nargs_plus_requires_one(self):
+        cmd = Command(name="test", handler=lambda c: 0, arguments=[Argument(name="files", nargs="+")])
+        with pytest.raises(UsageError):
+            Parser(cmd).parse([])
+        assert Parser(cmd).parse(["a"]).arguments["files"] == ["a"]
+
+    def test_unknown_long_option(self):
+        cmd = Command(name="test", handler=lambda c: 0, arguments=[Argument(name="target", required=False)])
+        with pytest.raises(UsageError, match="No such option: --bogus"):
+            Parser(cmd).parse(["--bogus", "production"])
+
+    def test_unknown_short_option(self):
+        cmd = Command(name="test", handler=lambda c: 0)
+        with pytest.raises(UsageError, match="No such option: -x"):
+            Parser(cmd).parse(["-x"])
+
+    def test_option_missing_value(self):
+        cmd = Command(name="test", handler=lambda c: 0, options=[Option(name="model", short="m")])
+        with pytest.raises(UsageError, match="requires an argument"):
+            Parser(cmd).parse(["--model"])
+        with pytest.raises(UsageError, match="requires an argument"):
+            Parser(cmd).parse(["-m"])
+
+    def test_invalid_option_value(self):
+        cmd = Command(
+            name="test", handler=lambda c: 0,
+            options=[Option(name="lines", short="n", type=int, default=50)],
+            arguments=[Argument(name="port", type=int, required=False)]
+        )
+        with pytest.raises(UsageError, match="Invalid value for '--lines': 'abc'"):
+            Parser(cmd).parse(["--lines", "abc"])
+        with pytest.raises(UsageError, match="Invalid value for '-n': 'abc'"):
+            Parser(cmd).parse(["-n", "abc"])
+        with pytest.raises(UsageError, match="Invalid value for 'PORT': 'x'"):
+            Parser(cmd).parse(["x"])
+
+    def test_unexpected_extra_argument(self):
+        cmd = Command(name="test", handler=lambda c: 0, arguments=[Argument(name="a")])
+        with pytest.raises(UsageError, match="unexpected extra argument"):
+            Parser(cmd).parse(["1", "2"])
+
+    def test_unknown_subcommand(self):
+        sub = Command(name="sub", handler=lambda c: 0)
+        root = Command(name="root", handler=lambda c: 0, subcommands={"sub": sub})
+        with pytest.raises(UsageError, match="No such command 'nope'"):
+            Parser(root).parse(["nope"])
+
+    def test_help_requested(self):
+        cmd = Command(name="test", handler=lambda c: 0, arguments=[Argument(name="name")])
+        assert Parser(cmd).parse(["--help"]).help_requested
+        assert Parser(cmd).parse(["-h"]).help_requested
+
+    def test_nested_parent_chain(self):
+        leaf = Command(name="leaf", handler=lambda c: 0)
+        mid = Command(name="mid", handler=lambda c: 0, subcommands={"leaf": leaf})
+        root = Command(name="root", handler=lambda c: 0, subcommands={"mid": mid})
+        ctx = Parser(root).parse(["mid", "leaf"])
+        assert [ctx.command.name, ctx.parent.command.name, ctx.parent.parent.command.name] == ["leaf", "mid", "root"]
+
     def test_subcommand_routing(self):
         called = []
         sub = Command(name="sub", handler=lambda c: called.append("sub"))
@@ -148,6 +293,46 @@ class TestCLI:
         assert "greet" in app.root.subcommands
         assert app.root.subcommands["greet"].help == "Say hello"
 
+    def test_register_option(self):
+        app = CLI("test")
+        seen = []
+
+        @app.option("count", short="c", type=int, default=1)
+        @app.command("repeat", help="Repeat")
+        def repeat(ctx):
+            seen.append(ctx.get("count"))
+            return 0
+
+        app.run(["repeat", "-c", "3"])
+        app.run(["repeat"])
+        assert seen == [3, 1]
+
+    def test_register_argument(self):
+        app = CLI("test")
+
+        @app.argument("target", help="Where to go")
+        @app.command("go", help="Go")
+        def go(ctx):
+            return 0
+
+        arg = app.root.subcommands["go"].arguments[0]
+        assert arg.name == "target"
+        assert arg.help == "Where to go"
+
+    def test_argument_order(self):
+        app = CLI("test")
+        seen = []
+
+        @app.argument("key")
+        @app.argument("value")
+        @app.command("set", help="Set")
+        def set_value(ctx):
+            seen.append((ctx.get("key"), ctx.get("value")))
+            return 0
+
+        app.run(["set", "a", "b"])
+        assert seen == [("a", "b")]
+
     def test_run_command(self):
         app = CLI("test")
         results = []
@@ -175,6 +360,65 @@ class TestCLI:
         captured = capsys.readouterr()
         assert "myapp" in captured.out
 
+    def test_run_help_lists_root_options(self, capsys):
+        app = CLI("myapp", version="1.0")
+        app.root.add_option(Option(name="config", short="c", help="Config file path"))
+        app.root.add_option(Option(name="verbose", type=bool, default=False, is_flag=True, help="Verbose output"))
+        assert app.run(["-h"]) == 0
+        out = capsys.readouterr().out
+        assert "-c, --config    Config file path" in out
+        assert "    --verbose   Verbose output" in out
+        assert "-v, --version" in out
+
+    def test_run_usage_error(self, capsys):
+        app = CLI("test")
+        called = []
+
+        @app.argument("name")
+        @app.command("delete", help="Delete")
+        def delete(ctx):
+            called.append(ctx.get("name"))
+            return 0
+
+        assert app.run(["delete"]) == 2
+        assert app.run(["delete", "--bogus", "x"]) == 2
+        assert app.run(["nope"]) == 2
+        assert called == []
+        assert "Missing argument 'NAME'" in capsys.readouterr().err
+
+    def test_run_invalid_value_skips_error_hooks(self, capsys):
+        app = CLI("test")
+        errors = []
+
+        @app.option("lines", short="n", type=int, default=50)
+        @app.command("logs", help="Logs")
+        def logs(ctx):
+            return 0
+
+        app.add_hook("error", errors.append)
+        assert app.run(["logs", "-n", "abc"]) == 2
+        assert errors == []
+        assert "Invalid value for '-n': 'abc'" in capsys.readouterr().err
+
+    def test_run_command_help(self, capsys):
+        app = CLI("test")
+        called = []
+
+        @app.argument("message", required=False, help="Text to send")
+        @app.option("model", short="m", help="Model to use")
+        @app.option("stream", is_flag=True, help="Stream response")
+        @app.command("chat", help="Chat")
+        def chat(ctx):
+            called.append(True)
+            return 0
+
+        assert app.run(["chat", "--help"]) == 0
+        assert called == []
+        out = capsys.readouterr().out
+        assert out.startswith("test chat\n")
+        assert "[MESSAGE]" in out and "Text to send" in out
+        assert out.index("--model") < out.index("--stream")
+
     def test_error_handling(self):
         app = CLI("test")
         errors = []
@@ -188,6 +432,20 @@ class TestCLI:
         assert code == 1
         assert "boom" in errors[0]
 
+    @pytest.mark.parametrize("exc", [EOFError, KeyboardInterrupt])
+    def test_run_aborted(self, capsys, exc):
+        app = CLI("test")
+        errors = []
+
+        @app.command("reset", help="Reset")
+        def reset(ctx):
+            raise exc()
+
+        app.add_hook("error", errors.append)
+        assert app.run(["reset"]) == 1
+        assert errors == []
+        assert capsys.readouterr().err == "\nAborted!\n"
+
     def test_before_hook(self):
         app = CLI("test")
         hooks = []
@@ -228,6 +486,82 @@ class TestGroup:
         assert code == 0
         assert results == ["migrated"]
 
+    def test_group_command_option(self):
+        app = CLI("test")
+        db = Group(app, "db", help="Database")
+        seen = []
+
+        @app.option("steps", type=int, default=1)
+        @db.command("rollback", help="Roll back")
+        def rollback(ctx):
+            seen.append(ctx.get("steps"))
+            return 0
+
+        app.run(["db", "rollback", "--steps", "2"])
+        assert seen == [2]
+
+    def test_group_help(self, capsys):
+        app = CLI("test")
+        db = Group(app, "db", help="Database")
+
+        @db.command("migrate", help="Run migrations")
+        def migrate(ctx):
+            return 0
+
+        code = app.run(["db"])
+        assert code == 0
+        captured = capsys.readouterr()
+        assert "migrate" in captured.out
+
+    def test_group_help_flag(self, capsys):
+        app = CLI("test")
+        db = Group(app, "db", help="Database")
+
+        @db.command("migrate", help="Run migrations")
+        def migrate(ctx):
+            return 0
+
+        assert app.run(["db", "-h"]) == 0
+        assert app.run(["db", "migrate", "--help"]) == 0
+        out = capsys.readouterr().out
+        assert "migrate" in out
+        assert "test db migrate" in out
+
+    def test_group_unknown_command(self, capsys):
+        app = CLI("test")
+        db = Group(app, "db", help="Database")
+
+        @db.command("migrate", help="Run migrations")
+        def migrate(ctx):
+            return 0
+
+        assert app.run(["db", "nope"]) == 2
+        assert "No such command 'nope'" in capsys.readouterr().err
+
+    def test_lazy_group(self, tmp_path, monkeypatch):
+        import types
+
+        app = CLI("test")
+        host = types.ModuleType("lazy_host")
+        host.app = app
+        monkeypatch.setitem(sys.modules, "lazy_host", host)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        (tmp_path / "lazy_cmds.py").write_text(
+            "from lazy_host import app\n"
+            "from roadcli.cli import Group\n"
+            "grp = Group(app, 'lazy', help='Lazy')\n"
+            "@grp.command('ping', help='Ping')\n"
+            "def ping(ctx):\n"
+            "    return 7\n"
+        )
+
+        app.lazy_group("lazy", "lazy_cmds", help="Lazy")
+        assert "lazy_cmds" not in sys.modules
+        assert app.root.subcommands["lazy"].help == "Lazy"
+        assert app.run(["lazy", "ping"]) == 7
+        assert app.root.subcommands["lazy"].loader is None
+        monkeypatch.delitem(sys.modules, "lazy_cmds")
+
     def test_group_registered(self):
         app = CLI("test")
         Group(app, "config", help="Config commands")
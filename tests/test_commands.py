@@ -0,0 +1,37 @@
+"""Tests for the helpers shared by the command modules."""
+
+import io
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from roadcli.commands import plain_output, write_plain
+
+
+class FakeTTY(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestPlainOutput:
+    @pytest.mark.parametrize("value, expected", [
+        (None, False), ("", False), ("0", False), ("1", True), ("yes", True),
+    ])
+    def test_road_plain_on_a_terminal(self, monkeypatch, value, expected):
+        monkeypatch.setattr(sys, "stdout", FakeTTY())
+        if value is None:
+            monkeypatch.delenv("ROAD_PLAIN", raising=False)
+        else:
+            monkeypatch.setenv("ROAD_PLAIN", value)
+        assert plain_output() is expected
+
+    def test_not_a_terminal(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+        monkeypatch.setenv("ROAD_PLAIN", "0")
+        assert plain_output() is True
+
+    def test_write_plain(self, capsys):
+        write_plain([("api", "running"), ("redis", "down")])
+        assert capsys.readouterr().out == "api\trunning\nredis\tdown\n"
@@ -0,0 +1,115 @@
+"""Tests for the config commands and their parse cache."""
+
+import os
+import subprocess
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+yaml = pytest.importorskip("yaml")
+pytest.importorskip("rich")
+
+import roadcli.main  # noqa: F401  (registers the root --config option)
+from roadcli import app
+from roadcli.cli import Context
+from roadcli.commands import config
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("api:\n  url: https://api.example\n  timeout: 30\n")
+    return path
+
+
+def bump_mtime(path, by_ns):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + by_ns))
+
+
+class TestConfigCache:
+    def test_unchanged_file_reuses_parse(self, config_file):
+        assert config._load_config(config_file) is config._load_config(config_file)
+
+    def test_rewrite_invalidates(self, config_file):
+        first = config._load_config(config_file)
+        config_file.write_text("api:\n  url: https://other.example\n  timeout: 30\n")
+        bump_mtime(config_file, 1_000_000)
+        second = config._load_config(config_file)
+        assert second is not first
+        assert second["api"]["url"] == "https://other.example"
+
+    def test_same_size_new_mtime_invalidates(self, config_file):
+        config._load_config(config_file)
+        config_file.write_text(config_file.read_text().replace("30", "60"))
+        bump_mtime(config_file, 1_000_000)
+        assert config._load_config(config_file)["api"]["timeout"] == 60
+
+    def test_get_nested(self, config_file):
+        config_id = config._config_id(config_file)
+        assert config._get_nested(*config_id, "api.url") == "https://api.example"
+        assert config._get_nested(*config_id, "api") == {"url": "https://api.example", "timeout": 30}
+        assert config._get_nested(*config_id, "api.missing") is config._MISSING
+        # dict -> scalar -> key must be "not found", not an error
+        assert config._get_nested(*config_id, "api.url.host") is config._MISSING
+        assert config._get_nested(*config_id, "api.timeout.x") is config._MISSING
+
+
+class TestConfigPath:
+    def test_option_overrides_default(self, tmp_path):
+        ctx = Context()
+        ctx.options["config"] = str(tmp_path / "c.yaml")
+        assert config.get_config_path(ctx) == tmp_path / "c.yaml"
+
+    def test_without_option_uses_module_path(self):
+        ctx = Context()
+        ctx.options["config"] = None
+        assert config.get_config_path(ctx) == config._CONFIG_PATH
+        assert config.get_config_path() == config._CONFIG_PATH
+
+    def test_env_then_default(self, tmp_path):
+        probe = "from roadcli.commands.config import get_config_path; print(get_config_path())"
+        env = dict(os.environ, PYTHONPATH=SRC, HOME=str(tmp_path))
+        env.pop("ROAD_CONFIG", None)
+        out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == str(tmp_path / ".roadcli" / "config.yaml")
+        env["ROAD_CONFIG"] = str(tmp_path / "env.yaml")
+        out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == str(tmp_path / "env.yaml")
+
+
+class TestConfigCommands:
+    def run(self, capsys, *args):
+        code = app.run(list(args))
+        return code, capsys.readouterr().out
+
+    def test_get_key(self, capsys, config_file):
+        code, out = self.run(capsys, "--config", str(config_file), "config", "get", "api.url")
+        assert code == 0
+        assert out.strip() == "https://api.example"
+
+    def test_get_missing_key(self, capsys, config_file):
+        _, out = self.run(capsys, "-c", str(config_file), "config", "get", "api.url.host")
+        assert "Key 'api.url.host' not found" in out
+
+    def test_get_without_file(self, capsys, tmp_path):
+        _, out = self.run(capsys, "-c", str(tmp_path / "none.yaml"), "config", "get")
+        assert "No config file" in out
+
+    def test_set_then_get(self, capsys, config_file):
+        code, _ = self.run(capsys, "-c", str(config_file), "config", "set", "api.url", "https://new.example")
+        assert code == 0
+        _, out = self.run(capsys, "-c", str(config_file), "config", "get", "api.url")
+        assert out.strip() == "https://new.example"
+
+        self.run(capsys, "-c", str(config_file), "config", "set", "ai.temperature", "0.5")
+        _, out = self.run(capsys, "-c", str(config_file), "config", "get", "ai.temperature")
+        assert out.strip() == "0.5"
+        assert yaml.safe_load(config_file.read_text())["api"]["timeout"] == 30
+
+    def test_path(self, capsys, config_file):
+        _, out = self.run(capsys, "-c", str(config_file), "config", "path")
+        assert out.splitlines() == [str(config_file), f"Size: {config_file.stat().st_size} bytes"]
@@ -0,0 +1,158 @@
+"""Tests for the interactive helpers."""
+
+import io
+import itertools
+import sys
+import os
+import threading
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from roadcli import interactive
+from roadcli.interactive import InteractivePrompts, LiveDisplay, SimpleConsole, TableBuilder
+
+
+@pytest.fixture
+def rich_console():
+    """An in-memory terminal console; skips when Rich is not installed."""
+    console = pytest.importorskip("rich.console")
+    return console.Console(file=io.StringIO(), force_terminal=True, width=60)
+
+
+class TestTableBuilderFallback:
+    def show(self, monkeypatch, capsys, builder):
+        monkeypatch.setattr(interactive, "RICH_AVAILABLE", False)
+        builder.show()
+        return capsys.readouterr().out
+
+    def test_aligned_columns(self, monkeypatch, capsys):
+        builder = TableBuilder(SimpleConsole(), "Services", ["name", "status"])
+        builder.add_row(["api", "healthy"]).add_row(["worker-long", "down"])
+        out = self.show(monkeypatch, capsys, builder)
+        assert out.splitlines() == [
+            "",
+            "Services",
+            "========",
+            "name        | status",
+            "---------------------",
+            "api         | healthy",
+            "worker-long | down",
+        ]
+
+    def test_short_rows_keep_all_columns(self, monkeypatch, capsys):
+        builder = TableBuilder(SimpleConsole(), None, ["a", "b", "c"])
+        builder.add_row(["1", "2", "3"]).add_row(["x"])
+        out = self.show(monkeypatch, capsys, builder)
+        assert out.splitlines() == [
+            "a | b | c",
+            "---------",
+            "1 | 2 | 3",
+            "x |   |",
+        ]
+
+    def test_rows_without_columns(self, monkeypatch, capsys):
+        builder = TableBuilder(SimpleConsole())
+        builder.add_row(["one", "two"]).add_row(["three"])
+        out = self.show(monkeypatch, capsys, builder)
+        assert out.splitlines() == ["one   | two", "three |"]
+
+
+class TestMultiSelect:
+    def select(self, monkeypatch, reply):
+        monkeypatch.setattr(interactive, "RICH_AVAILABLE", False)
+        monkeypatch.setattr("builtins.input", lambda prompt="": reply)
+        prompts = InteractivePrompts(SimpleConsole())
+        return prompts.multi_select("Pick", ["a", "b", "c"])
+
+    def test_comma_separated(self, monkeypatch):
+        assert self.select(monkeypatch, " 1, 3 ") == ["a", "c"]
+
+    def test_keywords(self, monkeypatch):
+        assert self.select(monkeypatch, "ALL") == ["a", "b", "c"]
+        assert self.select(monkeypatch, "none") == []
+
+    def test_malformed_tokens_ignored(self, monkeypatch):
+        assert self.select(monkeypatch, "1-3") == []
+        assert self.select(monkeypatch, "a2,3") == ["c"]
+        assert self.select(monkeypatch, "0,4,2") == ["b"]
+
+
+class TestLiveDisplay:
+    def test_stop_event_ends_display(self, rich_console):
+        stop = threading.Event()
+        timer = threading.Timer(0.2, stop.set)
+        timer.start()
+        LiveDisplay(rich_console).live_table(
+            lambda: [{"name": "api", "status": "up"}], ["name", "status"],
+            refresh_rate=0.05, stop_event=stop,
+        )
+        timer.join()
+        assert "api" in rich_console.file.getvalue()
+
+    def test_frame_error_is_reraised(self, rich_console):
+        calls = itertools.count()
+
+        def update():
+            if next(calls) >= 2:
+                raise RuntimeError("backend down")
+            return [{"name": "api"}]
+
+        # No stop_event: returning at all proves the display ended on the error.
+        with pytest.raises(RuntimeError, match="backend down"):
+            LiveDisplay(rich_console).live_table(update, ["name"], refresh_rate=0.05)
+
+    def test_dashboard_panel_error_is_reraised(self, rich_console):
+        def broken():
+            raise KeyError("cpu")
+
+        with pytest.raises(KeyError):
+            LiveDisplay(rich_console).dashboard({"CPU": broken}, refresh_rate=0.05)
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_non_positive_refresh_rate(self, rich_console, rate):
+        with pytest.raises(ValueError, match="refresh_rate"):
+            LiveDisplay(rich_console).dashboard({"CPU": lambda: "1%"}, refresh_rate=rate)
+
+
+class TestSharedProgress:
+    def test_nested_contexts_share_one_progress(self, rich_console):
+        display = interactive.ProgressDisplay(rich_console)
+        key = id(rich_console)
+
+        with display.spinner("Deploying"):
+            progress, users = interactive._shared_progress[key]
+            assert users == 1
+            with display.progress_bar(10, "Uploading") as bar:
+                assert interactive._shared_progress[key] == [progress, 2]
+                bar.advance(5)
+                assert len(progress.tasks) == 2
+            assert interactive._shared_progress[key] == [progress, 1]
+            assert len(progress.tasks) == 1
+            assert progress.live.is_started
+
+        assert interactive._shared_progress == {}
+        assert not progress.live.is_started
+
+    def test_multi_progress_releases_its_tasks(self, rich_console):
+        display = interactive.ProgressDisplay(rich_console)
+
+        with display.spinner("Outer"):
+            progress = interactive._shared_progress[id(rich_console)][0]
+            with display.multi_progress() as multi:
+                multi.add_task("a", total=3)
+                multi.add_task("b", total=3)
+                multi.advance("a")
+                assert len(progress.tasks) == 3
+            assert len(progress.tasks) == 1
+
+        assert interactive._shared_progress == {}
+
+    def test_release_after_error(self, rich_console):
+        display = interactive.ProgressDisplay(rich_console)
+
+        with pytest.raises(RuntimeError):
+            with display.spinner("Working"):
+                raise RuntimeError("failed")
+
+        assert interactive._shared_progress == {}
@@ -0,0 +1,109 @@
+"""Tests for the secrets commands' local index."""
+
+import json
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+keyring = pytest.importorskip("keyring")
+
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+
+from roadcli import app
+from roadcli.commands import secrets
+
+
+class MemoryKeyring(KeyringBackend):
+    """In-memory keyring backend."""
+
+    priority = 1
+
+    def __init__(self):
+        super().__init__()
+        self.store = {}
+
+    def get_password(self, service, username):
+        return self.store.get((service, username))
+
+    def set_password(self, service, username, password):
+        self.store[(service, username)] = password
+
+    def delete_password(self, service, username):
+        try:
+            del self.store[(service, username)]
+        except KeyError:
+            raise PasswordDeleteError(username)
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("ROAD_PLAIN", "1")
+    monkeypatch.setattr(secrets, "_INDEX_PATH", tmp_path / ".roadcli" / "secrets.index")
+    previous = keyring.get_keyring()
+    fake = MemoryKeyring()
+    keyring.set_keyring(fake)
+    yield fake
+    keyring.set_keyring(previous)
+
+
+def index_names():
+    return [e["name"] for e in secrets._read_index()]
+
+
+class TestSecretsIndex:
+    def test_set_indexes_and_list_reads_index(self, backend, capsys):
+        assert app.run(["secrets", "set", "API_KEY", "sk-1"]) == 0
+        assert app.run(["secrets", "set", "API_KEY", "sk-2"]) == 0
+        assert backend.store[("roadcli", "API_KEY")] == "sk-2"
+        assert index_names() == ["API_KEY"]
+
+        capsys.readouterr()
+        assert app.run(["secrets", "list"]) == 0
+        name, provider, modified = capsys.readouterr().out.rstrip("\n").split("\t")
+        assert (name, provider, modified) == ("API_KEY", "local", "just now")
+
+    def test_delete_removes_index_entry(self, backend):
+        app.run(["secrets", "set", "A", "1"])
+        app.run(["secrets", "set", "B", "2"])
+        assert app.run(["secrets", "delete", "A", "--force"]) == 0
+        assert ("roadcli", "A") not in backend.store
+        assert index_names() == ["B"]
+
+    def test_delete_drops_stale_entry_missing_from_keyring(self, backend, capsys):
+        app.run(["secrets", "set", "GONE", "1"])
+        backend.store.clear()
+        assert app.run(["secrets", "delete", "GONE", "--force"]) == 0
+        assert index_names() == []
+        assert "not found in keyring" in capsys.readouterr().out
+
+    def test_index_failure_reported_separately(self, backend, capsys, monkeypatch):
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(secrets, "_update_index", fail)
+        app.run(["secrets", "set", "KEY", "v"])
+        out = capsys.readouterr().out
+        assert backend.store[("roadcli", "KEY")] == "v"
+        assert "saved to keyring" in out and "index could not be updated" in out
+        assert "Failed to save" not in out
+
+    def test_update_index_is_atomic_and_locked(self, backend):
+        secrets._update_index("X", "local")
+        secrets._update_index("X", "vault")
+        index = secrets._INDEX_PATH
+        entries = json.loads(index.read_text())
+        assert sorted((e["name"], e["provider"]) for e in entries) == [("X", "local"), ("X", "vault")]
+        assert index.with_suffix(".lock").exists()
+        assert not index.with_suffix(".tmp").exists()
+
+        secrets._update_index("X", "local", remove=True)
+        assert [e["provider"] for e in secrets._read_index()] == ["vault"]
+
+    def test_corrupt_index_reads_empty(self, backend):
+        secrets._INDEX_PATH.parent.mkdir(parents=True)
+        secrets._INDEX_PATH.write_text("{not json")
+        assert secrets._read_index() == []